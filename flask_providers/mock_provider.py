@@ -12,12 +12,43 @@ This server starts 5 different providers on different ports:
 Some objects have overlapping IDs across providers to test merging capabilities.
 """
 
-from flask import Flask, jsonify
+from flask import Flask, request
+from werkzeug.serving import WSGIRequestHandler, make_server
+import hashlib
 import json
-import threading
-import time
+import selectors
 import random
-from datetime import datetime, timedelta
+import sys
+from collections import Counter
+from datetime import date
+from functools import lru_cache
+
+# Fixed seed so every start generates the same objects
+MOCK_DATA_SEED = 0xDEADBEEF
+
+# Generated dates are offsets from the day the data is generated
+TODAY_ORDINAL = date.today().toordinal()
+
+@lru_cache(maxsize=None)
+def date_from_today(day_offset):
+    """Format the date `day_offset` days from today as YYYY-MM-DD."""
+    return date.fromordinal(TODAY_ORDINAL + day_offset).isoformat()
+
+def sample_rows(pool, sizes):
+    """Draw one sample without replacement from pool for each size in sizes, each as a tuple.
+    
+    Each row partially shuffles a single shared index order in place (Fisher-Yates), so a row
+    costs one random draw per picked item instead of a fresh random.sample over the pool."""
+    rand = random.random
+    pool_size = len(pool)
+    order = list(range(pool_size))
+    rows = []
+    for size in sizes:
+        for i in range(size):
+            j = i + int(rand() * (pool_size - i))
+            order[i], order[j] = order[j], order[i]
+        rows.append(tuple([pool[order[i]] for i in range(size)]))
+    return rows
 
 # Generate realistic data with cross-references
 def generate_hr_data():
@@ -35,7 +66,7 @@ def generate_hr_data():
     
     # Create CEO (no manager)
     ceo = {
-        "__types__": ["person", "employee", "executive"],
+        "__types__": ("person", "employee", "executive"),
         "__id__": "emp_001",
         "__source__": "hr_database",
         "name": "Sarah Johnson",
@@ -44,7 +75,7 @@ def generate_hr_data():
         "salary": 250000,
         "hire_date": "2020-01-01",
         "manager_id": None,
-        "skills": ["Leadership", "Strategy", "Business Development"],
+        "skills": ("Leadership", "Strategy", "Business Development"),
         "level": "C-Suite"
     }
     employees.append(ceo)
@@ -52,66 +83,84 @@ def generate_hr_data():
     # Create VPs (report to CEO)
     vp_titles = ["VP Engineering", "VP Marketing", "VP Sales", "VP Operations"]
     for i, title in enumerate(vp_titles):
+        vp_department = title.split()[1]
         vp = {
-            "__types__": ["person", "employee", "executive"],
+            "__types__": ("person", "employee", "executive"),
             "__id__": f"emp_{i+2:03d}",
             "__source__": "hr_database",
-            "name": f"VP {title.split()[1]}",
+            "name": f"VP {vp_department}",
             "title": title,
-            "department": title.split()[1],
+            "department": vp_department,
             "salary": 180000,
             "hire_date": "2020-06-01",
             "manager_id": "emp_001",
-            "skills": ["Leadership", "Management", title.split()[1]],
+            "skills": ("Leadership", "Management", vp_department),
             "level": "VP"
         }
         employees.append(vp)
     
     # Create managers (report to VPs)
+    manager_skills_column = sample_rows(skills_list, [4] * (3 * len(departments)))
+    manager_types = ("person", "employee", "manager")
     manager_count = 0
-    for dept in departments:
+    for dept_index, dept in enumerate(departments):
+        manager_title = sys.intern(f"{dept} Manager")
+        vp_id = sys.intern(f"emp_{dept_index+2:03d}")
         for j in range(3):  # 3 managers per department
             manager_count += 1
             manager = {
-                "__types__": ["person", "employee", "manager"],
+                "__types__": manager_types,
                 "__id__": f"emp_{manager_count+5:03d}",
                 "__source__": "hr_database",
                 "name": f"Manager {j+1} {dept}",
-                "title": f"{dept} Manager",
+                "title": manager_title,
                 "department": dept,
                 "salary": 120000,
                 "hire_date": "2021-03-01",
-                "manager_id": f"emp_{departments.index(dept)+2:03d}",
-                "skills": random.sample(skills_list, 4),
+                "manager_id": vp_id,
+                "skills": manager_skills_column[manager_count - 1],
                 "level": "Manager"
             }
             employees.append(manager)
     
     # Create individual contributors (report to managers)
+    # Random fields are drawn as whole columns, then zipped into records
+    ics_per_department = 20
+    ic_total = ics_per_department * len(departments)
+    salary_column = random.choices(range(60000, 100001), k=ic_total)
+    hire_date_column = [date_from_today(-days) for days in random.choices(range(30, 1001), k=ic_total)]
+    skills_column = sample_rows(skills_list, random.choices(range(2, 6), k=ic_total))
+    
+    # Records share one __types__ tuple and one title string per department rather than each
+    # allocating its own copy; nothing mutates them after generation
+    ic_types = ("person", "employee", "individual_contributor")
     ic_count = manager_count + 5
-    for dept in departments:
-        for k in range(20):  # 20 ICs per department
+    ic_index = 0
+    for dept_index, dept in enumerate(departments):
+        manager_id = sys.intern(f"emp_{dept_index+5:03d}")
+        ic_title = sys.intern(f"{dept} Specialist")
+        for k in range(ics_per_department):
             ic_count += 1
-            manager_id = f"emp_{departments.index(dept)+5:03d}"
             ic = {
-                "__types__": ["person", "employee", "individual_contributor"],
+                "__types__": ic_types,
                 "__id__": f"emp_{ic_count:03d}",
                 "__source__": "hr_database",
                 "name": f"Employee {k+1} {dept}",
-                "title": f"{dept} Specialist",
+                "title": ic_title,
                 "department": dept,
-                "salary": random.randint(60000, 100000),
-                "hire_date": (datetime.now() - timedelta(days=random.randint(30, 1000))).strftime("%Y-%m-%d"),
+                "salary": salary_column[ic_index],
+                "hire_date": hire_date_column[ic_index],
                 "manager_id": manager_id,
-                "skills": random.sample(skills_list, random.randint(2, 5)),
+                "skills": skills_column[ic_index],
                 "level": "Individual Contributor"
             }
             employees.append(ic)
+            ic_index += 1
     
     return employees
 
-def generate_crm_data():
-    """Generate 150+ customers with assigned employee references."""
+def generate_crm_data(sales_employee_ids):
+    """Generate 150+ customers assigned to the given sales employees."""
     customers = []
     companies = [
         "Acme Corp", "TechStart Inc", "Global Solutions", "Innovation Labs",
@@ -121,42 +170,51 @@ def generate_crm_data():
     ]
     statuses = ["active", "prospect", "inactive", "churned", "qualified"]
     
-    # Get employee IDs from HR data for assignments
-    hr_employees = [emp["__id__"] for emp in generate_hr_data() if emp["department"] in ["Sales", "Account Management"]]
-    
-    for i in range(150):
+    # Draw each random column in one call rather than one call per field per customer
+    count = 150
+    company_column = random.choices(companies, k=count)
+    email_company_column = random.choices(companies, k=count)
+    status_column = random.choices(statuses, k=count)
+    contact_days_column = random.choices(range(1, 366), k=count)
+    value_column = random.choices(range(10000, 500001), k=count)
+    assigned_column = random.choices(sales_employee_ids, k=count)
+    industry_column = random.choices(["Technology", "Healthcare", "Finance", "Retail", "Manufacturing", "Education"], k=count)
+    lead_source_column = random.choices(["Website", "Referral", "Cold Call", "Trade Show", "Social Media"], k=count)
+    
+    customer_types = ("person", "customer")
+    for i in range(count):
         customer = {
-            "__types__": ["person", "customer"],
+            "__types__": customer_types,
             "__id__": f"cust_{i+1:03d}",
             "__source__": "crm_system",
             "name": f"Customer {i+1}",
-            "company": random.choice(companies),
-            "email": f"customer{i+1}@{random.choice(companies).lower().replace(' ', '')}.com",
-            "status": random.choice(statuses),
-            "last_contact": (datetime.now() - timedelta(days=random.randint(1, 365))).strftime("%Y-%m-%d"),
-            "value": random.randint(10000, 500000),
-            "assigned_employee_id": random.choice(hr_employees),
-            "industry": random.choice(["Technology", "Healthcare", "Finance", "Retail", "Manufacturing", "Education"]),
-            "lead_source": random.choice(["Website", "Referral", "Cold Call", "Trade Show", "Social Media"])
+            "company": company_column[i],
+            "email": f"customer{i+1}@{email_company_column[i].lower().replace(' ', '')}.com",
+            "status": status_column[i],
+            "last_contact": date_from_today(-contact_days_column[i]),
+            "value": value_column[i],
+            "assigned_employee_id": assigned_column[i],
+            "industry": industry_column[i],
+            "lead_source": lead_source_column[i]
         }
         customers.append(customer)
     
     return customers
 
-def generate_inventory_data():
-    """Generate 100+ products with creator references."""
+def generate_inventory_data(creator_employee_ids):
+    """Generate 100+ products created by the given employees."""
     products = []
     categories = ["Software", "Hardware", "Service", "Consulting", "Training", "Support"]
     software_products = ["SA Framework", "Data Analyzer", "Cloud Manager", "Security Suite", "API Gateway"]
     hardware_products = ["Quantum Computer", "AI Server", "Network Switch", "Storage Array", "IoT Device"]
-    
-    # Get employee IDs from HR data for creators
-    hr_employees = [emp["__id__"] for emp in generate_hr_data() if emp["department"] in ["Engineering", "Product"]]
+    software_product_types = ("product", "software")
+    hardware_product_types = ("product", "hardware")
+    service_product_types = ("product", "service")
     
     for i in range(100):
         if i < 30:  # Software products
             product = {
-                "__types__": ["product", "software"],
+                "__types__": software_product_types,
                 "__id__": f"prod_{i+1:03d}",
                 "__source__": "inventory_system",
                 "name": random.choice(software_products) + f" v{random.randint(1,5)}.{random.randint(0,9)}",
@@ -164,14 +222,14 @@ def generate_inventory_data():
                 "version": f"{random.randint(1,5)}.{random.randint(0,9)}.{random.randint(0,9)}",
                 "price": random.randint(50, 500),
                 "stock": random.randint(100, 10000),
-                "tags": random.sample(["AI", "Cloud", "Security", "Analytics", "API", "Mobile"], 3),
-                "creator_employee_id": random.choice(hr_employees),
-                "release_date": (datetime.now() - timedelta(days=random.randint(30, 1000))).strftime("%Y-%m-%d"),
-                "platforms": random.sample(["Windows", "Mac", "Linux", "Web", "Mobile"], random.randint(1, 3))
+                "tags": tuple(random.sample(["AI", "Cloud", "Security", "Analytics", "API", "Mobile"], 3)),
+                "creator_employee_id": random.choice(creator_employee_ids),
+                "release_date": date_from_today(-random.randint(30, 1000)),
+                "platforms": tuple(random.sample(["Windows", "Mac", "Linux", "Web", "Mobile"], random.randint(1, 3)))
             }
         elif i < 60:  # Hardware products
             product = {
-                "__types__": ["product", "hardware"],
+                "__types__": hardware_product_types,
                 "__id__": f"prod_{i+1:03d}",
                 "__source__": "inventory_system",
                 "name": random.choice(hardware_products) + f" {random.choice(['Pro', 'Enterprise', 'Standard'])}",
@@ -179,113 +237,126 @@ def generate_inventory_data():
                 "specs": f"{random.randint(100, 10000)} {random.choice(['qubits', 'cores', 'GB RAM', 'TB storage'])}",
                 "price": random.randint(1000, 100000),
                 "stock": random.randint(1, 100),
-                "tags": random.sample(["High-Performance", "Enterprise", "Research", "Cloud-Native"], 2),
-                "creator_employee_id": random.choice(hr_employees),
+                "tags": tuple(random.sample(["High-Performance", "Enterprise", "Research", "Cloud-Native"], 2)),
+                "creator_employee_id": random.choice(creator_employee_ids),
                 "warranty_years": random.randint(1, 5),
                 "dimensions": f"{random.randint(10, 100)}x{random.randint(10, 100)}x{random.randint(10, 100)}cm"
             }
         else:  # Services
             service_types = ["Data Consulting", "Cloud Migration", "Security Audit", "Performance Optimization", "Training"]
             product = {
-                "__types__": ["product", "service"],
+                "__types__": service_product_types,
                 "__id__": f"prod_{i+1:03d}",
                 "__source__": "inventory_system",
                 "name": random.choice(service_types),
                 "category": "Professional Services",
                 "hourly_rate": random.randint(100, 300),
                 "availability": random.choice(["immediate", "1 week", "2 weeks", "1 month"]),
-                "tags": random.sample(["Consulting", "Data", "Strategy", "Implementation", "Support"], 3),
-                "creator_employee_id": random.choice(hr_employees),
+                "tags": tuple(random.sample(["Consulting", "Data", "Strategy", "Implementation", "Support"], 3)),
+                "creator_employee_id": random.choice(creator_employee_ids),
                 "duration_hours": random.randint(8, 160),
-                "certification_required": random.choice([True, False])
+                "certification_required": random.random() < 0.5
             }
         products.append(product)
     
     return products
 
-def generate_analytics_data():
-    """Generate 80+ datasets with owner references."""
+def generate_analytics_data(owner_employee_ids):
+    """Generate 80+ datasets owned by the given employees."""
     datasets = []
     schema_types = ["financial_transactions", "user_interactions", "sales_data", "customer_behavior", 
                    "product_performance", "employee_metrics", "system_logs", "marketing_campaigns"]
     
-    # Get employee IDs from HR data for owners
-    hr_employees = [emp["__id__"] for emp in generate_hr_data() if emp["department"] in ["Engineering", "Analytics", "Finance"]]
-    
-    for i in range(80):
+    # Draw each random column in one call rather than one call per field per dataset
+    count = 80
+    uniform = random.uniform
+    dataset_kinds = ["financial", "user_behavior", "operational", "marketing"]
+    dataset_types = {kind: ("dataset", kind) for kind in dataset_kinds}
+    kind_column = random.choices(dataset_kinds, k=count)
+    quarter_column = random.choices(['Q1', 'Q2', 'Q3', 'Q4'], k=count)
+    year_column = random.choices(range(2020, 2025), k=count)
+    name_schema_column = random.choices(schema_types, k=count)
+    size_column = [round(uniform(0.1, 50.0), 1) for _ in range(count)]
+    records_column = random.choices(range(1000, 10000001), k=count)
+    updated_days_column = random.choices(range(1, 366), k=count)
+    schema_column = random.choices(schema_types, k=count)
+    owner_column = random.choices(owner_employee_ids, k=count)
+    frequency_column = random.choices(["daily", "weekly", "monthly", "quarterly"], k=count)
+    retention_column = random.choices(range(90, 2556), k=count)
+    access_column = random.choices(["public", "internal", "restricted", "confidential"], k=count)
+    
+    for i in range(count):
         dataset = {
-            "__types__": ["dataset", random.choice(["financial", "user_behavior", "operational", "marketing"])],
+            "__types__": dataset_types[kind_column[i]],
             "__id__": f"data_{i+1:03d}",
             "__source__": "analytics_engine",
-            "name": f"{random.choice(['Q1', 'Q2', 'Q3', 'Q4'])} {random.randint(2020, 2024)} {random.choice(schema_types).replace('_', ' ').title()}",
-            "size_gb": round(random.uniform(0.1, 50.0), 1),
-            "records": random.randint(1000, 10000000),
-            "last_updated": (datetime.now() - timedelta(days=random.randint(1, 365))).strftime("%Y-%m-%d"),
-            "schema": random.choice(schema_types),
-            "owner_employee_id": random.choice(hr_employees),
-            "refresh_frequency": random.choice(["daily", "weekly", "monthly", "quarterly"]),
-            "retention_days": random.randint(90, 2555),
-            "access_level": random.choice(["public", "internal", "restricted", "confidential"])
+            "name": f"{quarter_column[i]} {year_column[i]} {name_schema_column[i].replace('_', ' ').title()}",
+            "size_gb": size_column[i],
+            "records": records_column[i],
+            "last_updated": date_from_today(-updated_days_column[i]),
+            "schema": schema_column[i],
+            "owner_employee_id": owner_column[i],
+            "refresh_frequency": frequency_column[i],
+            "retention_days": retention_column[i],
+            "access_level": access_column[i]
         }
         datasets.append(dataset)
     
     return datasets
 
-def generate_document_data():
-    """Generate 120+ documents with author/creator references."""
+def generate_document_data(author_employee_ids):
+    """Generate 120+ documents written and reviewed by the given employees."""
     documents = []
     doc_types = ["contract", "report", "proposal", "policy", "procedure", "manual", "presentation", "memo"]
     statuses = ["draft", "review", "approved", "published", "archived"]
-    
-    # Get employee IDs from HR data for authors
-    hr_employees = [emp["__id__"] for emp in generate_hr_data()]
+    document_types = {doc_type: ("document", doc_type) for doc_type in doc_types}
     
     for i in range(120):
         doc_type = random.choice(doc_types)
         if doc_type == "contract":
             document = {
-                "__types__": ["document", "contract"],
+                "__types__": document_types["contract"],
                 "__id__": f"doc_{i+1:03d}",
                 "__source__": "document_store",
                 "title": f"{random.choice(['Service', 'Employment', 'Vendor', 'Partnership'])} Agreement",
                 "type": "contract",
                 "size_mb": round(random.uniform(0.5, 10.0), 1),
-                "created": (datetime.now() - timedelta(days=random.randint(1, 1000))).strftime("%Y-%m-%d"),
+                "created": date_from_today(-random.randint(1, 1000)),
                 "status": random.choice(statuses),
-                "parties": [f"Company {chr(65 + random.randint(0, 25))}", f"Company {chr(65 + random.randint(0, 25))}"],
-                "author_employee_id": random.choice(hr_employees),
+                "parties": (f"Company {chr(65 + random.randint(0, 25))}", f"Company {chr(65 + random.randint(0, 25))}"),
+                "author_employee_id": random.choice(author_employee_ids),
                 "contract_value": random.randint(10000, 1000000),
-                "expiry_date": (datetime.now() + timedelta(days=random.randint(30, 3650))).strftime("%Y-%m-%d")
+                "expiry_date": date_from_today(random.randint(30, 3650))
             }
         elif doc_type == "report":
             document = {
-                "__types__": ["document", "report"],
+                "__types__": document_types["report"],
                 "__id__": f"doc_{i+1:03d}",
                 "__source__": "document_store",
                 "title": f"{random.choice(['Annual', 'Quarterly', 'Monthly', 'Weekly'])} {random.choice(['Performance', 'Financial', 'Operational', 'Marketing'])} Report",
                 "type": "report",
                 "size_mb": round(random.uniform(1.0, 20.0), 1),
-                "created": (datetime.now() - timedelta(days=random.randint(1, 1000))).strftime("%Y-%m-%d"),
+                "created": date_from_today(-random.randint(1, 1000)),
                 "status": random.choice(statuses),
                 "pages": random.randint(5, 100),
-                "author_employee_id": random.choice(hr_employees),
+                "author_employee_id": random.choice(author_employee_ids),
                 "report_period": f"{random.randint(2020, 2024)}-{random.randint(1, 12):02d}",
-                "executive_summary": random.choice([True, False])
+                "executive_summary": random.random() < 0.5
             }
         else:
             document = {
-                "__types__": ["document", doc_type],
+                "__types__": document_types[doc_type],
                 "__id__": f"doc_{i+1:03d}",
                 "__source__": "document_store",
                 "title": f"{doc_type.title()} - {random.choice(['Project', 'Process', 'Policy', 'Training'])} {i+1}",
                 "type": doc_type,
                 "size_mb": round(random.uniform(0.1, 15.0), 1),
-                "created": (datetime.now() - timedelta(days=random.randint(1, 1000))).strftime("%Y-%m-%d"),
+                "created": date_from_today(-random.randint(1, 1000)),
                 "status": random.choice(statuses),
-                "author_employee_id": random.choice(hr_employees),
-                "reviewer_employee_id": random.choice(hr_employees),
+                "author_employee_id": random.choice(author_employee_ids),
+                "reviewer_employee_id": random.choice(author_employee_ids),
                 "version": f"{random.randint(1, 10)}.{random.randint(0, 9)}",
-                "tags": random.sample(["Important", "Confidential", "Draft", "Final", "Archived"], 2)
+                "tags": tuple(random.sample(["Important", "Confidential", "Draft", "Final", "Archived"], 2))
             }
         documents.append(document)
     
@@ -294,106 +365,73 @@ def generate_document_data():
 def create_overlapping_objects():
     """Create objects that appear in multiple providers to test merging capabilities."""
     
+    # Each overlapping object is built from the fields every provider agrees on, plus the
+    # source and whatever that provider adds on top
+    alex_chen = {
+        "__types__": ("person", "employee", "sales_representative"),
+        "__id__": "emp_overlap_001",
+        "name": "Alex Chen",
+        "title": "Senior Sales Representative",
+        "department": "Sales",
+        "hire_date": "2021-08-15",
+        "manager_id": "emp_002",
+        "skills": ("Sales", "CRM", "Negotiation", "Account Management"),
+        "level": "Senior",
+        "performance_rating": 4.2
+    }
+    maria_rodriguez = {
+        "__types__": ("person", "employee", "engineer"),
+        "__id__": "emp_overlap_002",
+        "name": "Maria Rodriguez",
+        "title": "Software Engineer",
+        "department": "Engineering",
+        "hire_date": "2022-01-10",
+        "manager_id": "emp_005",
+        "skills": ("Python", "JavaScript", "React", "AWS"),
+        "level": "Mid-level"
+    }
+    david_kim = {
+        "__types__": ("person", "employee", "analyst"),
+        "__id__": "emp_overlap_003",
+        "name": "David Kim",
+        "title": "Data Analyst",
+        "department": "Analytics",
+        "hire_date": "2022-03-20",
+        "manager_id": "emp_008",
+        "skills": ("SQL", "Python", "Tableau", "Statistics"),
+        "level": "Junior"
+    }
+    
     # Create some overlapping employee objects (HR + CRM perspectives)
     overlapping_employees = [
+        {**alex_chen, "__source__": "hr_database", "salary": 85000},
         {
-            "__types__": ["person", "employee", "sales_representative"],
-            "__id__": "emp_overlap_001",
-            "__source__": "hr_database",
-            "name": "Alex Chen",
-            "title": "Senior Sales Representative",
-            "department": "Sales",
-            "salary": 85000,
-            "hire_date": "2021-08-15",
-            "manager_id": "emp_002",
-            "skills": ["Sales", "CRM", "Negotiation", "Account Management"],
-            "level": "Senior",
-            "performance_rating": 4.2
-        },
-        {
-            "__types__": ["person", "employee", "sales_representative"],
-            "__id__": "emp_overlap_001",
+            **alex_chen,
             "__source__": "crm_system",
-            "name": "Alex Chen",
-            "title": "Senior Sales Representative",
-            "department": "Sales",
-            "hire_date": "2021-08-15",
-            "manager_id": "emp_002",
-            "skills": ["Sales", "CRM", "Negotiation", "Account Management"],
-            "level": "Senior",
-            "performance_rating": 4.2,
             "crm_access_level": "full",
             "assigned_customers": 23,
             "sales_quota": 1200000,
             "current_performance": "exceeding"
         },
+        {**maria_rodriguez, "__source__": "hr_database", "salary": 95000},
         {
-            "__types__": ["person", "employee", "engineer"],
-            "__id__": "emp_overlap_002",
-            "__source__": "hr_database",
-            "name": "Maria Rodriguez",
-            "title": "Software Engineer",
-            "department": "Engineering",
-            "salary": 95000,
-            "hire_date": "2022-01-10",
-            "manager_id": "emp_005",
-            "skills": ["Python", "JavaScript", "React", "AWS"],
-            "level": "Mid-level"
-        },
-        {
-            "__types__": ["person", "employee", "engineer"],
-            "__id__": "emp_overlap_002",
+            **maria_rodriguez,
             "__source__": "inventory_system",
-            "name": "Maria Rodriguez",
-            "title": "Software Engineer",
-            "department": "Engineering",
-            "hire_date": "2022-01-10",
-            "manager_id": "emp_005",
-            "skills": ["Python", "JavaScript", "React", "AWS"],
-            "level": "Mid-level",
             "products_created": 8,
             "technical_lead": False,
             "code_review_rating": 4.5
         },
+        {**david_kim, "__source__": "hr_database", "salary": 78000},
         {
-            "__types__": ["person", "employee", "analyst"],
-            "__id__": "emp_overlap_003",
-            "__source__": "hr_database",
-            "name": "David Kim",
-            "title": "Data Analyst",
-            "department": "Analytics",
-            "salary": 78000,
-            "hire_date": "2022-03-20",
-            "manager_id": "emp_008",
-            "skills": ["SQL", "Python", "Tableau", "Statistics"],
-            "level": "Junior"
-        },
-        {
-            "__types__": ["person", "employee", "analyst"],
-            "__id__": "emp_overlap_003",
+            **david_kim,
             "__source__": "analytics_engine",
-            "name": "David Kim",
-            "title": "Data Analyst",
-            "department": "Analytics",
-            "hire_date": "2022-03-20",
-            "manager_id": "emp_008",
-            "skills": ["SQL", "Python", "Tableau", "Statistics"],
-            "level": "Junior",
             "datasets_owned": 12,
             "data_access_level": "internal",
             "last_analysis": "2024-01-15"
         },
         {
-            "__types__": ["person", "employee", "analyst"],
-            "__id__": "emp_overlap_003",
+            **david_kim,
             "__source__": "document_store",
-            "name": "David Kim",
-            "title": "Data Analyst",
-            "department": "Analytics",
-            "hire_date": "2022-03-20",
-            "manager_id": "emp_008",
-            "skills": ["SQL", "Python", "Tableau", "Statistics"],
-            "level": "Junior",
             "documents_created": 15,
             "document_approval_rate": 0.95,
             "last_document": "2024-01-20"
@@ -401,34 +439,24 @@ def create_overlapping_objects():
     ]
     
     # Create some overlapping product objects (Inventory + Analytics perspectives)
+    sa_framework = {
+        "__types__": ("product", "software"),
+        "__id__": "prod_overlap_001",
+        "name": "SA Framework v2.1",
+        "category": "Software",
+        "version": "2.1.0",
+        "price": 299,
+        "stock": 1000,
+        "tags": ("AI", "Cloud", "Analytics"),
+        "creator_employee_id": "emp_overlap_002",
+        "release_date": "2023-11-15",
+        "platforms": ("Windows", "Mac", "Linux", "Web")
+    }
     overlapping_products = [
+        {**sa_framework, "__source__": "inventory_system"},
         {
-            "__types__": ["product", "software"],
-            "__id__": "prod_overlap_001",
-            "__source__": "inventory_system",
-            "name": "SA Framework v2.1",
-            "category": "Software",
-            "version": "2.1.0",
-            "price": 299,
-            "stock": 1000,
-            "tags": ["AI", "Cloud", "Analytics"],
-            "creator_employee_id": "emp_overlap_002",
-            "release_date": "2023-11-15",
-            "platforms": ["Windows", "Mac", "Linux", "Web"]
-        },
-        {
-            "__types__": ["product", "software"],
-            "__id__": "prod_overlap_001",
+            **sa_framework,
             "__source__": "analytics_engine",
-            "name": "SA Framework v2.1",
-            "category": "Software",
-            "version": "2.1.0",
-            "price": 299,
-            "stock": 1000,
-            "tags": ["AI", "Cloud", "Analytics"],
-            "creator_employee_id": "emp_overlap_002",
-            "release_date": "2023-11-15",
-            "platforms": ["Windows", "Mac", "Linux", "Web"],
             "usage_metrics": {
                 "active_users": 1250,
                 "daily_usage_hours": 8.5,
@@ -442,37 +470,27 @@ def create_overlapping_objects():
     ]
     
     # Create some overlapping customer objects (CRM + Analytics perspectives)
+    customer_alpha = {
+        "__types__": ("person", "customer"),
+        "__id__": "cust_overlap_001",
+        "name": "Enterprise Customer Alpha",
+        "company": "Alpha Corp",
+        "email": "contact@alphacorp.com",
+        "status": "active",
+        "last_contact": "2024-01-10",
+        "value": 250000,
+        "assigned_employee_id": "emp_overlap_001",
+        "industry": "Technology",
+        "lead_source": "Website"
+    }
     overlapping_customers = [
+        {**customer_alpha, "__source__": "crm_system"},
         {
-            "__types__": ["person", "customer"],
-            "__id__": "cust_overlap_001",
-            "__source__": "crm_system",
-            "name": "Enterprise Customer Alpha",
-            "company": "Alpha Corp",
-            "email": "contact@alphacorp.com",
-            "status": "active",
-            "last_contact": "2024-01-10",
-            "value": 250000,
-            "assigned_employee_id": "emp_overlap_001",
-            "industry": "Technology",
-            "lead_source": "Website"
-        },
-        {
-            "__types__": ["person", "customer"],
-            "__id__": "cust_overlap_001",
+            **customer_alpha,
             "__source__": "analytics_engine",
-            "name": "Enterprise Customer Alpha",
-            "company": "Alpha Corp",
-            "email": "contact@alphacorp.com",
-            "status": "active",
-            "last_contact": "2024-01-10",
-            "value": 250000,
-            "assigned_employee_id": "emp_overlap_001",
-            "industry": "Technology",
-            "lead_source": "Website",
             "usage_patterns": {
                 "login_frequency": "daily",
-                "feature_usage": ["analytics", "reporting", "export"],
+                "feature_usage": ("analytics", "reporting", "export"),
                 "session_duration": 45
             },
             "customer_satisfaction": 4.7
@@ -480,35 +498,25 @@ def create_overlapping_objects():
     ]
     
     # Create some overlapping document objects (Document Store + Analytics perspectives)
+    financial_report = {
+        "__types__": ("document", "report"),
+        "__id__": "doc_overlap_001",
+        "title": "Q4 2023 Financial Performance Report",
+        "type": "report",
+        "size_mb": 8.5,
+        "created": "2024-01-05",
+        "status": "published",
+        "pages": 45,
+        "author_employee_id": "emp_overlap_003",
+        "report_period": "2023-Q4",
+        "executive_summary": True
+    }
     overlapping_documents = [
+        {**financial_report, "__source__": "document_store"},
         {
-            "__types__": ["document", "report"],
-            "__id__": "doc_overlap_001",
-            "__source__": "document_store",
-            "title": "Q4 2023 Financial Performance Report",
-            "type": "report",
-            "size_mb": 8.5,
-            "created": "2024-01-05",
-            "status": "published",
-            "pages": 45,
-            "author_employee_id": "emp_overlap_003",
-            "report_period": "2023-Q4",
-            "executive_summary": True
-        },
-        {
-            "__types__": ["document", "report"],
-            "__id__": "doc_overlap_001",
+            **financial_report,
             "__source__": "analytics_engine",
-            "title": "Q4 2023 Financial Performance Report",
-            "type": "report",
-            "size_mb": 8.5,
-            "created": "2024-01-05",
-            "status": "published",
-            "pages": 45,
-            "author_employee_id": "emp_overlap_003",
-            "report_period": "2023-Q4",
-            "executive_summary": True,
-            "data_sources": ["financial_system", "crm_system", "hr_database"],
+            "data_sources": ("financial_system", "crm_system", "hr_database"),
             "generated_charts": 12,
             "view_count": 156,
             "download_count": 23
@@ -525,22 +533,32 @@ def create_overlapping_objects():
 def verify_unique_ids(provider_data):
     """Verify that each provider has unique IDs within itself."""
     for provider_name, objects in provider_data.items():
-        ids = [obj["__id__"] for obj in objects]
-        unique_ids = set(ids)
-        if len(ids) != len(unique_ids):
-            duplicates = [id for id in ids if ids.count(id) > 1]
+        id_counts = Counter(obj["__id__"] for obj in objects)
+        if len(id_counts) != len(objects):
+            duplicates = [obj_id for obj_id, count in id_counts.items() if count > 1]
             raise ValueError(f"Provider {provider_name} has duplicate IDs: {duplicates}")
         print(f"✓ {provider_name}: {len(objects)} objects, all IDs unique")
 
 # Provider configurations with generated data and overlapping objects
-def get_provider_data():
-    """Get data for each provider with some overlapping objects."""
+def generate_provider_data():
+    """Generate data for each provider with some overlapping objects."""
+    random.seed(MOCK_DATA_SEED)
+    
+    # Generate the employees once; the other providers reference them by id
+    hr_data = generate_hr_data()
+    
+    def employee_ids(departments=None):
+        return [emp["__id__"] for emp in hr_data if departments is None or emp["department"] in departments]
+    
+    # The remaining generators are independent but run serially on purpose: they're pure-Python
+    # and take a few milliseconds in total, so a thread pool is slower under the GIL and a
+    # process pool costs far more to start than it saves
     base_data = {
-        "hr_database": generate_hr_data(),
-        "crm_system": generate_crm_data(),
-        "inventory_system": generate_inventory_data(),
-        "analytics_engine": generate_analytics_data(),
-        "document_store": generate_document_data()
+        "hr_database": hr_data,
+        "crm_system": generate_crm_data(employee_ids({"Sales", "Account Management"})),
+        "inventory_system": generate_inventory_data(employee_ids({"Engineering", "Product"})),
+        "analytics_engine": generate_analytics_data(employee_ids({"Engineering", "Analytics", "Finance"})),
+        "document_store": generate_document_data(employee_ids())
     }
     
     overlapping = create_overlapping_objects()
@@ -577,40 +595,43 @@ def get_provider_data():
     
     return base_data
 
+# Generate the data once and split it across the providers below
+PROVIDER_DATA = generate_provider_data()
+
 PROVIDERS = [
     {
         "name": "HR Database",
         "port": 5042,
         "mode": "ALL_AT_ONCE",
-        "data": get_provider_data()["hr_database"],
+        "data": PROVIDER_DATA["hr_database"],
         "description": "Employee and HR information with manager relationships (includes overlapping objects)"
     },
     {
         "name": "CRM System", 
         "port": 5043,
         "mode": "ALL_AT_ONCE",
-        "data": get_provider_data()["crm_system"],
+        "data": PROVIDER_DATA["crm_system"],
         "description": "Customer relationship management with employee assignments (includes overlapping objects)"
     },
     {
         "name": "Inventory System",
         "port": 5044, 
         "mode": "ALL_AT_ONCE",
-        "data": get_provider_data()["inventory_system"],
+        "data": PROVIDER_DATA["inventory_system"],
         "description": "Product and service catalog with creator references (includes overlapping objects)"
     },
     {
         "name": "Analytics Engine",
         "port": 5045,
         "mode": "ALL_AT_ONCE", 
-        "data": get_provider_data()["analytics_engine"],
+        "data": PROVIDER_DATA["analytics_engine"],
         "description": "Data analytics and datasets with owner references (includes overlapping objects)"
     },
     {
         "name": "Document Store",
         "port": 5046,
         "mode": "ALL_AT_ONCE",
-        "data": get_provider_data()["document_store"],
+        "data": PROVIDER_DATA["document_store"],
         "description": "Document management system with author references (includes overlapping objects)"
     }
 ]
@@ -620,52 +641,84 @@ def create_provider_app(provider_config):
     """Create a Flask app for a specific provider."""
     app = Flask(f"provider_{provider_config['port']}")
     
+    # Every response body is fixed for the life of the server, so each is encoded once here
+    # and the views only wrap the bytes
+    hello_body = app.json.response({
+        "name": provider_config["name"],
+        "mode": provider_config["mode"],
+        "description": provider_config["description"],
+        "version": "1.0.0"
+    }).get_data()
+    
     @app.route('/hello')
     def hello():
         """Provider information endpoint."""
-        return jsonify({
-            "name": provider_config["name"],
-            "mode": provider_config["mode"],
-            "description": provider_config["description"],
-            "version": "1.0.0"
-        })
+        return app.response_class(hello_body, mimetype="application/json")
+    
+    # The payload is encoded once and kept in memory, so nothing is left behind on disk however
+    # the server is stopped. It's tagged by its content so a client polling with If-None-Match
+    # gets an empty 304
+    all_data_body = app.json.response(provider_config["data"]).get_data()
+    all_data_etag = hashlib.blake2b(all_data_body, digest_size=8).hexdigest()
     
     @app.route('/all_data')
     def all_data():
         """Data endpoint that returns all SAObjects."""
-        return jsonify(provider_config["data"])
+        response = app.response_class(all_data_body, mimetype="application/json")
+        response.set_etag(all_data_etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = 3600
+        return response.make_conditional(request, accept_ranges=True, complete_length=len(all_data_body))
+    
+    root_body = app.json.response({
+        "service": provider_config["name"],
+        "endpoints": {
+            "/hello": "Provider information",
+            "/all_data": "All SAObject data"
+        },
+        "status": "running"
+    }).get_data()
     
     @app.route('/')
     def root():
         """Root endpoint with basic info."""
-        return jsonify({
-            "service": provider_config["name"],
-            "endpoints": {
-                "/hello": "Provider information",
-                "/all_data": "All SAObject data"
-            },
-            "status": "running"
-        })
+        return app.response_class(root_body, mimetype="application/json")
     
     return app
 
 
+class QuietRequestHandler(WSGIRequestHandler):
+    """Request handler that skips the per-request access log line; errors are still logged."""
+    def log_request(self, code="-", size="-"):
+        pass
+
+
 def start_provider(provider_config):
-    """Start a provider server in a separate thread."""
+    """Start a provider server; its requests are handled once serve_providers() runs."""
     app = create_provider_app(provider_config)
     port = provider_config["port"]
     
-    def run_server():
-        app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False)
-    
-    thread = threading.Thread(target=run_server, daemon=True)
-    thread.start()
+    # A threaded server without the dev-server extras of app.run(). It binds and listens on the port
+    # right here, so a port that's already taken fails immediately, and once this returns clients
+    # can connect (they queue until serve_providers() accepts them) without waiting for a warm-up
+    server = make_server('0.0.0.0', port, app, threaded=True, request_handler=QuietRequestHandler)
     
-    # Give the server a moment to start
-    time.sleep(0.5)
     print(f"  ✓ Started {provider_config['name']} on port {port} ({len(provider_config['data'])} objects)")
     
-    return thread
+    return server
+
+
+def serve_providers(servers):
+    """Accept connections for every provider server in one loop, forever.
+    
+    Each accepted request is still handled on its own thread by the threaded server, so this
+    replaces one accept loop per provider thread with a single one."""
+    with selectors.DefaultSelector() as selector:
+        for server in servers:
+            selector.register(server, selectors.EVENT_READ, server)
+        while True:
+            for key, _ in selector.select():
+                key.data.handle_request()
 
 
 if __name__ == '__main__':
@@ -678,12 +731,12 @@ if __name__ == '__main__':
     print()
     
     # Start all providers
-    threads = []
+    servers = []
     total_objects = 0
     for provider in PROVIDERS:
         print(f"Starting {provider['name']}...")
-        thread = start_provider(provider)
-        threads.append(thread)
+        server = start_provider(provider)
+        servers.append(server)
         total_objects += len(provider['data'])
     
     print()
@@ -705,9 +758,8 @@ if __name__ == '__main__':
     print("Press Ctrl+C to stop all providers")
     
     try:
-        # Keep the main thread alive
-        while True:
-            time.sleep(1)
+        # Serve every provider from the main thread
+        serve_providers(servers)
     except KeyboardInterrupt:
         print("\n\n🛑 Shutting down all providers...")
         print("Goodbye!") 
\ No newline at end of file
@@ -5,7 +5,8 @@ Simple mock provider for testing the SA Query Language Shell.
 This server starts 1 provider on port 5042 that returns one simple object.
 """
 
-from flask import Flask, jsonify
+from flask import Flask
+from werkzeug.serving import make_server
 import threading
 import time
 
@@ -15,41 +16,62 @@ import os
 
 SIMPLE_OBJECTS_FILE = os.environ.get("SIMPLE_OBJECTS_FILE", "simple_objects.json")
 
+# ((mtime_ns, size), objects) of the last parse of SIMPLE_OBJECTS_FILE
+_simple_objects_cache = None
+
 def get_simple_objects():
-    """Read the simple objects from a file on every request."""
-    with open(SIMPLE_OBJECTS_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Read the simple objects from a file, re-parsing it only when it has changed."""
+    global _simple_objects_cache
+    stat = os.stat(SIMPLE_OBJECTS_FILE)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _simple_objects_cache
+    if cached is None or cached[0] != version:
+        with open(SIMPLE_OBJECTS_FILE, "r", encoding="utf-8") as f:
+            cached = _simple_objects_cache = (version, json.load(f))
+    return cached[1]
 
 def create_simple_app():
     """Create a Flask app for the simple provider."""
     app = Flask("simple_provider")
     
+    # The info responses never change, so they're encoded once here rather than per request
+    hello_body = app.json.response({
+        "name": "Simple Provider",
+        "mode": "ALL_AT_ONCE",
+        "description": "Simple provider with one test object",
+        "version": "1.0.0"
+    }).get_data()
+    root_body = app.json.response({
+        "service": "Simple Provider",
+        "endpoints": {
+            "/hello": "Provider information",
+            "/all_data": "Single SAObject data"
+        },
+        "status": "running"
+    }).get_data()
+    
+    # (objects, encoded body) for /all_data, re-encoded only when the objects are re-read.
+    # Swapped as one tuple so concurrent requests never pair a body with the wrong objects
+    all_data_cache = (None, b"")
+    
     @app.route('/hello')
     def hello():
         """Provider information endpoint."""
-        return jsonify({
-            "name": "Simple Provider",
-            "mode": "ALL_AT_ONCE",
-            "description": "Simple provider with one test object",
-            "version": "1.0.0"
-        })
+        return app.response_class(hello_body, mimetype="application/json")
     
     @app.route('/all_data')
     def all_data():
         """Data endpoint that returns the single SAObject."""
-        return jsonify(get_simple_objects())
+        nonlocal all_data_cache
+        objects = get_simple_objects()
+        if all_data_cache[0] is not objects:
+            all_data_cache = (objects, app.json.response(objects).get_data())
+        return app.response_class(all_data_cache[1], mimetype="application/json")
     
     @app.route('/')
     def root():
         """Root endpoint with basic info."""
-        return jsonify({
-            "service": "Simple Provider",
-            "endpoints": {
-                "/hello": "Provider information",
-                "/all_data": "Single SAObject data"
-            },
-            "status": "running"
-        })
+        return app.response_class(root_body, mimetype="application/json")
     
     return app
 
@@ -58,14 +80,13 @@ def start_simple_provider():
     app = create_simple_app()
     port = 5042
     
-    def run_server():
-        app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False)
+    # make_server binds and listens before returning, so the provider accepts connections as soon
+    # as the thread is serving, with no warm-up delay to guess at
+    server = make_server('0.0.0.0', port, app, threaded=True)
     
-    thread = threading.Thread(target=run_server, daemon=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     
-    # Give the server a moment to start
-    time.sleep(0.5)
     print(f"✓ Started Simple Provider on port {port}")
     
     return thread
@@ -1,10 +1,13 @@
 from __future__ import annotations
+from collections import defaultdict
 from dataclasses import dataclass, field
+from copy import copy
 from ast import List
 from typing import TYPE_CHECKING, Optional
 from itertools import chain
 
 from sa.query_language.errors import QueryError
+from sa.query_language.debug import debugger
 
 if TYPE_CHECKING:
     from .sa_object import SAObject
@@ -12,44 +15,87 @@ if TYPE_CHECKING:
     from .types import SAType
     from sa.query_language.query_state import QueryState
 
-@dataclass
+# Keys of an object's json that aren't fields
+_META_FIELDS = frozenset(("__types__", "__id__", "__source__"))
+# Marks a field get_field hasn't cached yet (None is a valid field value)
+_MISSING = object()
+
+@dataclass(slots=True, frozen=True, eq=False)
 class ObjectGrouping:
+    """One object as seen by every source that defines its id.
+    
+    Frozen and slotted: there is one of these per id in a query, and the cached id sets below are
+    shared by derived groupings. The few deliberate updates go through object.__setattr__."""
     _objects: List[SAObject]
     _field_overrides: dict[str, SAType]
     _selected_fields: Optional[set[str]]
-    # Pre-computed cached properties
-    types: set[str] = field(default=None, init=False, repr=False)
-    id_types: set[tuple[str, str]] = field(default=None, init=False, repr=False)
-    unique_ids: set[tuple[str, str, str]] = field(default=None, init=False, repr=False)
-    sources: set[str] = field(default=None, init=False, repr=False)
+    # Pre-computed cached properties (frozen so derived groupings can share them)
+    types: frozenset[str] = field(default=None, init=False, repr=False)
+    id_types: frozenset[tuple[str, str]] = field(default=None, init=False, repr=False)
+    unique_ids: frozenset[tuple[str, str, str]] = field(default=None, init=False, repr=False)
+    sources: frozenset[str] = field(default=None, init=False, repr=False)
+    # str() of the grouping, formatted on first use (error messages, ObjectList's str)
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Scalar field values already reconciled by get_field, created on the first one
+    _field_values: Optional[dict[str, SAType]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        from sa.query_language.debug import debugger
-        assert len({obj.id for obj in self._objects}) == 1, f"ObjectGrouping has multiple ids: {self._objects}"
-        for obj in self._objects:
+        if __debug__:
+            # Imported here rather than at the top: sa_object's imports lead back to this module
             from sa.core.sa_object import SAObject
-            assert isinstance(obj, SAObject), f"ObjectGrouping must contain SAObject objects, got {type(obj).__name__}"
-        assert len({obj.source for obj in self._objects}) == len(self._objects), f"ObjectGrouping has objects from the same source: {self._objects}"
+            assert all(isinstance(obj, SAObject) for obj in self._objects), f"ObjectGrouping must contain SAObject objects, got {next(type(obj).__name__ for obj in self._objects if not isinstance(obj, SAObject))}"
+            assert len({obj.id for obj in self._objects}) == 1, f"ObjectGrouping has multiple ids: {self._objects}"
+        self._cache_sets()
+
+    @classmethod
+    def unchecked(cls, objects: List[SAObject]) -> ObjectGrouping:
+        """Create a grouping of SAObjects already known to share one id, skipping the id and type checks."""
+        grouping = object.__new__(cls)
+        object.__setattr__(grouping, "_objects", objects)
+        object.__setattr__(grouping, "_field_overrides", {})
+        object.__setattr__(grouping, "_selected_fields", None)
+        object.__setattr__(grouping, "_str", None)
+        object.__setattr__(grouping, "_field_values", None)
+        grouping._cache_sets()
+        return grouping
+
+    def _cache_sets(self):
+        sources = frozenset(obj.source for obj in self._objects)
+        assert len(sources) == len(self._objects), f"ObjectGrouping has objects from the same source: {self._objects}"
         
-        # Pre-compute all cached values
+        # Pre-compute all cached values once; _objects never changes after construction
         # Use chain.from_iterable to flatten without creating intermediate lists
-        self.types = set(chain.from_iterable(obj.types for obj in self._objects))
-        
-        # obj.id_types already returns a set, so we can chain them directly
-        self.id_types = set(chain.from_iterable(obj.id_types for obj in self._objects))
+        types = frozenset(chain.from_iterable(obj.types for obj in self._objects))
+        object.__setattr__(self, "types", types)
         
-        # obj.unique_ids already returns a set, so we can chain them directly
-        self.unique_ids = set(chain.from_iterable(obj.unique_ids for obj in self._objects))
+        # Every object shares the grouping's id, so the id sets are built straight from the types
+        # instead of merging a fresh id_types/unique_ids set per object
+        obj_id = self._objects[0].id
+        object.__setattr__(self, "id_types", frozenset((obj_id, type) for type in types))
+        object.__setattr__(self, "unique_ids", frozenset((obj_id, type, obj.source) for obj in self._objects for type in obj.types))
         
-        # Use set comprehension for better performance
-        self.sources = {obj.source for obj in self._objects}
+        object.__setattr__(self, "sources", sources)
+
+    def __eq__(self, other: object) -> bool:
+        # Same comparison the dataclass would generate, but groupings for different ids (nearly
+        # every pair) are told apart by their interned ids without comparing the objects' json
+        if other is self:
+            return True
+        if type(other) is not ObjectGrouping:
+            return NotImplemented
+        return (self.id == other.id and self._objects == other._objects
+                and self._field_overrides == other._field_overrides and self._selected_fields == other._selected_fields)
+
+    def __hash__(self) -> int:
+        # Equal groupings always share an id, so groupings can be set members and dict keys
+        return hash(self.id)
 
     def reset(self):
         """Reset field overrides and selected fields if they are set."""
         # Only reset if there's actually something to reset
         if self._field_overrides or self._selected_fields is not None:
-            self._field_overrides = {}
-            self._selected_fields = None
+            object.__setattr__(self, "_field_overrides", {})
+            object.__setattr__(self, "_selected_fields", None)
         # Note: We don't reset cache here because field_overrides/selected_fields
         # don't affect types/id_types/unique_ids/sources (which are computed from _objects)
 
@@ -73,34 +119,68 @@ class ObjectGrouping:
     
     @property
     def fields(self) -> set[str]:
-        all_fields = set.union(*[set(obj.properties.keys()) for obj in self._objects])
+        # Only the keys are needed, so skip building each object's resolved properties dict
+        keys = chain.from_iterable(obj.json.keys() for obj in self._objects)
         if self._selected_fields is not None:
-            all_fields = all_fields.intersection(self._selected_fields)
+            selected_fields = self._selected_fields
+            return {key for key in keys if key in selected_fields and key not in _META_FIELDS}
+        all_fields = set(keys)
+        all_fields.difference_update(_META_FIELDS)
         return all_fields
 
     def select_fields(self, fields: set[str]) -> ObjectGrouping:
-        return ObjectGrouping(self._objects, self._field_overrides, self._selected_fields | fields if self._selected_fields is not None else fields)
+        # Same objects, so share the cached id sets instead of re-running __post_init__
+        selected = copy(self)
+        object.__setattr__(selected, "_selected_fields", self._selected_fields | fields if self._selected_fields is not None else fields)
+        return selected
 
     def get_field(self, field_name: str, query_state: 'QueryState') -> 'SAType':
         if field_name in self._field_overrides:
             return self._field_overrides[field_name]
+        # The objects never change, so a field stored as a plain scalar reads the same every time
+        # and in every query. Stored lists and dicts aren't kept: they resolve to fresh objects
+        # per read (callers may change them), and custom types resolve against the query state
+        field_values = self._field_values
+        if field_values is not None:
+            value = field_values.get(field_name, _MISSING)
+            if value is not _MISSING:
+                return value
+        value = self._reconcile_field(field_name, query_state)
+        if not any(isinstance(obj.json.get(field_name), (list, dict)) for obj in self._objects):
+            if field_values is None:
+                field_values = {}
+                object.__setattr__(self, "_field_values", field_values)
+            field_values[field_name] = value
+        return value
+
+    def _reconcile_field(self, field_name: str, query_state: 'QueryState') -> 'SAType':
+        # Most groupings come from a single source, whose value needs no reconciling
+        if len(self._objects) == 1:
+            obj = self._objects[0]
+            if obj.has_field(field_name):
+                return obj.get_field(field_name, query_state)
         field_values_list = [obj.get_field(field_name, query_state) for obj in self._objects if obj.has_field(field_name)]
         if len(field_values_list) == 0:
             raise QueryError(f"Object {self} has no field \"{field_name}\"", could_succeed_with_more_data=True)
-        any_field_values_are_list_or_dict = any(isinstance(field_value, list) or isinstance(field_value, dict) for field_value in field_values_list)
+        any_field_values_are_list_or_dict = any(isinstance(field_value, (list, dict)) for field_value in field_values_list)
         if any_field_values_are_list_or_dict:
             if len(field_values_list) > 1:
                 raise QueryError(f"Field \"{field_name}\" of {self} has multiple definitions of list or dict from different sources. These can't be reconciled, please pick a source.")
             return field_values_list[0]
-        field_values = set(field_values_list)
-        if len(field_values) > 1:
-            raise QueryError(f"Field \"{field_name}\" of {self} has multiple conflicting definitions from different sources. Please pick a source.")
-        return field_values.pop()
+        # Usually only one source defines the field; otherwise every definition must agree
+        first = field_values_list[0]
+        for field_value in field_values_list[1:]:
+            if field_value != first:
+                raise QueryError(f"Field \"{field_name}\" of {self} has multiple conflicting definitions from different sources. Please pick a source.")
+        return first
 
     def has_field(self, field_name: str) -> bool:
         if field_name in self._field_overrides:
             return True
-        return any(obj.has_field(field_name) for obj in self._objects)
+        for obj in self._objects:
+            if field_name in obj.json:
+                return True
+        return False
 
     def get_all_field_values(self, field_name: str, query_state: 'QueryState') -> list['SAType']:
         if field_name in self._field_overrides:
@@ -108,30 +188,24 @@ class ObjectGrouping:
         return [obj.get_field(field_name, query_state) for obj in self._objects if obj.has_field(field_name)]
 
     def __str__(self) -> str:
-        return f"Obj({','.join(self.types)}#{self.id}@{'@'.join(self.sources)})"
+        # Only depends on the frozen id, types and sources, so it is safe to keep (and to share
+        # with select_fields copies)
+        if self._str is None:
+            object.__setattr__(self, "_str", f"Obj({','.join(self.types)}#{self.id}@{'@'.join(self.sources)})")
+        return self._str
 
 
 def group_objects(objects: List['SAObject']) -> List[ObjectGrouping]:
-    from sa.query_language.debug import debugger
-    id_to_objects = {}
-    
+    return list(group_objects_by_id(objects).values())
+
+def group_objects_by_id(objects: List['SAObject']) -> dict[str, ObjectGrouping]:
+    id_to_objects = defaultdict(list)
     for obj in objects:
-        obj_id = obj.id
-        if obj_id not in id_to_objects:
-            id_to_objects[obj_id] = []
-        id_to_objects[obj_id].append(obj)
-            # Create ObjectList for each group
+        id_to_objects[obj.id].append(obj)
+    
+    # One part for the whole loop; a part per grouping cost more than building the groupings
     debugger.start_part("GROUP_OBJECTS", "Group objects")
-    object_groups = []
-    for obj_id, objects in id_to_objects.items():
-        debugger.start_part("GROUP_OBJECTS_OBJECT", "Group objects iter")
-        object_groups.append(ObjectGrouping(objects, {}, None))
-        debugger.end_part("Group objects iter")
+    # Each bucket holds a single id by construction, so the groupings skip those checks
+    object_groups = {obj_id: ObjectGrouping.unchecked(objects) for obj_id, objects in id_to_objects.items()}
     debugger.end_part("Group objects")
     return object_groups
-
-def ungroup_objects(object_groups: List[ObjectGrouping]) -> List['SAObject']:
-    return [obj for group in object_groups for obj in group._objects]
-
-def regroup_objects(objects: List['ObjectGrouping']) -> List[ObjectGrouping]:
-    return group_objects(ungroup_objects(objects))
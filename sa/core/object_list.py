@@ -1,9 +1,27 @@
 from __future__ import annotations
-from sa.core.object_grouping import ObjectGrouping, group_objects, regroup_objects, ungroup_objects
+from collections import defaultdict
+from itertools import chain
+from typing import TYPE_CHECKING, Optional
+from sa.core.object_grouping import ObjectGrouping, group_objects_by_id
+from sa.core.types import SAType
+from sa.query_language.debug import debugger
+
+if TYPE_CHECKING:
+    from sa.core.sa_object import SAObject
+
+# Groupings bucketed by the value of one field, plus whether any grouping lacks the field
+FieldValueIndex = tuple[dict[SAType, list[ObjectGrouping]], bool]
 
 
 class ObjectList:
     _objects: list[ObjectGrouping]
+    _by_id: dict[str, ObjectGrouping] | None
+    _unique_ids: set[tuple[str, str, str]] | None
+    _id_types: set[tuple[str, str]] | None
+    _types: set[str] | None
+    _by_type: dict[str, ObjectList] | None
+    _by_source: dict[str, ObjectList] | None
+    _by_field_value: dict[str, Optional[FieldValueIndex]] | None
 
     def __init__(self, objects: list[ObjectGrouping]):
         """
@@ -13,25 +31,64 @@ class ObjectList:
             objects: List of ObjectGrouping objects
         """
         self._objects = objects
+        self._by_id = None
+        self._unique_ids = None
+        self._id_types = None
+        self._types = None
+        self._by_type = None
+        self._by_source = None
+        self._by_field_value = None
         assert all(isinstance(obj, ObjectGrouping) for obj in self._objects), \
             f"ObjectList must contain ObjectGrouping objects, got {', '.join([type(obj).__name__ for obj in self._objects])}"
     
+    @classmethod
+    def unchecked(cls, objects: list[ObjectGrouping]) -> ObjectList:
+        """Create an ObjectList from groupings taken from an existing ObjectList, skipping the type check."""
+        object_list = cls.__new__(cls)
+        object_list._objects = objects
+        object_list._by_id = None
+        object_list._unique_ids = None
+        object_list._id_types = None
+        object_list._types = None
+        object_list._by_type = None
+        object_list._by_source = None
+        object_list._by_field_value = None
+        return object_list
+
+    @classmethod
+    def from_sa_objects(cls, objects: list[SAObject]) -> ObjectList:
+        """Group SAObjects by id into a new ObjectList.
+
+        The result needs no validate_uniqueness: groupings for different ids can't share a
+        unique id, and each grouping already rejects two objects from one source. The id
+        buckets are kept as the list's id index rather than rebuilt on the first merge.
+        """
+        by_id = group_objects_by_id(objects)
+        object_list = cls.unchecked(list(by_id.values()))
+        object_list._by_id = by_id
+        return object_list
+    
     def validate_uniqueness(self):
         """Validate that all objects have unique IDs."""
-        from sa.query_language.debug import debugger
         debugger.start_part("VALIDATE_UNIQUENESS", "Validate object uniqueness")
-        seen = set()
-        for obj in self._objects:
-            debugger.start_part("VALIDATE_UNIQUENESS_OBJECT", "Validate object uniqueness")
-            uids = obj.unique_ids  # This will cache unique_ids, but that's necessary for validation
-            assert uids & seen == set(), f"Duplicate object found: {uids}"
-            seen.update(uids)
-            debugger.end_part("Validate object uniqueness")
+        # No part per object: on large lists the debugger calls cost more than the check itself.
+        # Like the asserts it stands for, the check is skipped under python -O
+        if __debug__:
+            all_unique_ids = set(chain.from_iterable(obj.unique_ids for obj in self._objects))
+            if len(all_unique_ids) != sum(len(obj.unique_ids) for obj in self._objects):
+                # Only a list with duplicates pays for finding the offending object
+                seen = set()
+                for obj in self._objects:
+                    uids = obj.unique_ids
+                    assert seen.isdisjoint(uids), f"Duplicate object found: {uids}"
+                    seen.update(uids)
+            # The set just built is exactly what the unique_ids property would build, so keep it
+            # for add_object and merge rather than rebuilding it on their first call
+            self._unique_ids = all_unique_ids
         debugger.end_part("Validate object uniqueness")
 
     def reset(self):
         """Reset all objects that have field overrides or selected fields set."""
-        from sa.query_language.debug import debugger
         debugger.start_part("RESET_OBJECTS", "Reset objects")
         
         reset_count = 0
@@ -40,14 +97,41 @@ class ObjectList:
                 obj.reset()
                 reset_count += 1
         
-        debugger.log("RESET_COUNT", f"Reset {reset_count} out of {len(self._objects)} objects")
+        if debugger.enabled:
+            debugger.log("RESET_COUNT", f"Reset {reset_count} out of {len(self._objects)} objects")
         debugger.end_part("Reset objects")
 
-    @staticmethod
-    def combine(ol1: ObjectList, ol2: ObjectList) -> ObjectList:
-        result = ObjectList(regroup_objects(ol1.objects + ol2.objects))
-        result.validate_uniqueness()
-        return result
+    def merge(self, other: ObjectList) -> None:
+        """Merge another ObjectList into this one in place, grouping objects that share an id.
+
+        Groupings for new ids are appended and ones for existing ids are merged into the
+        grouping already there. Only the incoming groupings are checked against this list's
+        unique ids, rather than revalidating the whole list.
+        """
+        unique_ids = self.unique_ids
+        # Check everything before mutating so a duplicate leaves this list untouched
+        for grouping in other.objects:
+            assert grouping.unique_ids.isdisjoint(unique_ids), f"Duplicate object found: {grouping.unique_ids}"
+        by_id = self._id_index()
+        replaced: dict[ObjectGrouping, ObjectGrouping] = {}
+        for grouping in other.objects:
+            existing = by_id.get(grouping.id)
+            if existing is None:
+                self._objects.append(grouping)
+                by_id[grouping.id] = grouping
+            else:
+                merged = ObjectGrouping(existing._objects + grouping._objects, {}, None)
+                replaced[existing] = merged
+                by_id[grouping.id] = merged
+            unique_ids.update(grouping.unique_ids)
+        if replaced:
+            self._objects = [replaced.get(obj, obj) for obj in self._objects]
+        # Merged groupings can gain types, sources and fields, so rebuild those indexes on next use
+        self._id_types = None
+        self._types = None
+        self._by_type = None
+        self._by_source = None
+        self._by_field_value = None
 
     @property
     def objects(self) -> list[ObjectGrouping]:
@@ -58,71 +142,154 @@ class ObjectList:
         
         The filtered result is guaranteed to be unique since it's a subset of this validated list.
         """
-        from sa.query_language.debug import debugger
         debugger.start_part("FILTER_LOOKUP", "Filter by type")
         
-        matching_objects = []
-        for obj in self._objects:
-            obj_types = obj.types
-            if type_name in obj_types:
-                matching_objects.append(obj)
+        matching = self._type_index().get(type_name)
         
         debugger.end_part("Filter by type")
-        return ObjectList(matching_objects)
+        return matching if matching is not None else ObjectList.unchecked([])
     
     def filter_by_source(self, source_name: str) -> 'ObjectList':
-        """Filter objects by source.
+        """Filter objects by source, narrowing each grouping to that source's object.
         
         The filtered result is guaranteed to be unique since it's a subset of this validated list.
         """
-        matching_objects = []
+        matching = self._source_index().get(source_name)
+        return matching if matching is not None else ObjectList.unchecked([])
+    
+    def _source_index(self) -> dict[str, ObjectList]:
+        # Like _type_index: one scan buckets every grouping under each of its sources, already
+        # narrowed to that source, and the same ObjectList is handed out for a source each time
+        if self._by_source is None:
+            by_source: defaultdict[str, list[ObjectGrouping]] = defaultdict(list)
+            for obj in self._objects:
+                if len(obj.sources) == 1:
+                    # Already narrowed to its only source
+                    by_source[next(iter(obj.sources))].append(obj)
+                    continue
+                for source_name in obj.sources:
+                    by_source[source_name].append(obj.select_sources({source_name}))
+            self._by_source = {source_name: ObjectList.unchecked(objects) for source_name, objects in by_source.items()}
+        return self._by_source
+    
+    def _type_index(self) -> dict[str, ObjectList]:
+        # Groupings bucketed by type, in list order. Built on first use so lists that are
+        # queried repeatedly (like all_data) answer type filters without scanning every grouping.
+        # The same ObjectList is handed out for a type each time, so indexes built on it
+        # (see field_value_index) carry over between queries. A type every grouping has maps back
+        # to this list itself, so its indexes are shared rather than rebuilt on an identical copy
+        if self._by_type is None:
+            # defaultdict only allocates a list for a new type, where setdefault built a
+            # throwaway one for every (grouping, type) pair
+            by_type: defaultdict[str, list[ObjectGrouping]] = defaultdict(list)
+            for obj in self._objects:
+                for type_name in obj.types:
+                    by_type[type_name].append(obj)
+            count = len(self._objects)
+            self._by_type = {
+                type_name: self if len(objects) == count else ObjectList.unchecked(objects)
+                for type_name, objects in by_type.items()
+            }
+        return self._by_type
+    
+    def field_value_index(self, field_name: str) -> Optional[FieldValueIndex]:
+        """Bucket the groupings by the value of a scalar field, in list order.
+
+        This lets equality filters look up their matches instead of checking every grouping.
+        Returns None when some grouping's value can't be read up front (a list/dict value,
+        an override, or conflicting definitions); callers then fall back to evaluating each
+        grouping. Built on first use per field.
+        """
+        if self._by_field_value is None:
+            self._by_field_value = {}
+        if field_name in self._by_field_value:
+            return self._by_field_value[field_name]
+
+        index: Optional[FieldValueIndex] = None
+        buckets: defaultdict[SAType, list[ObjectGrouping]] = defaultdict(list)
+        has_missing = False
         for obj in self._objects:
-            if source_name in obj.sources:
-                matching_objects.append(obj.select_sources({source_name}))
-        
-        return ObjectList(matching_objects)
+            if obj._field_overrides:
+                break
+            sa_objects = obj._objects
+            if len(sa_objects) == 1:
+                # Most groupings have a single source: read its json directly, no values list
+                json = sa_objects[0].json
+                if field_name not in json:
+                    has_missing = True
+                    continue
+                first = json[field_name]
+                if isinstance(first, (list, dict)):
+                    break
+                buckets[first].append(obj)
+                continue
+            values = [sa_object.json[field_name] for sa_object in sa_objects if field_name in sa_object.json]
+            if not values:
+                has_missing = True
+                continue
+            first = values[0]
+            if isinstance(first, (list, dict)) or any(value != first or isinstance(value, (list, dict)) for value in values[1:]):
+                break
+            buckets[first].append(obj)
+        else:
+            index = (buckets, has_missing)
+        self._by_field_value[field_name] = index
+        return index
+    
+    def _id_index(self) -> dict[str, ObjectGrouping]:
+        # Built on first use; add_object and merge keep it up to date afterwards
+        if self._by_id is None:
+            self._by_id = {}
+            for obj in self._objects:
+                self._by_id.setdefault(obj.id, obj)
+        return self._by_id
     
     def get_by_id(self, obj_id: str) -> ObjectList:
         """Get object by ID."""
-        from sa.query_language.debug import debugger
         debugger.start_part("GET_BY_ID_LOOKUP", "Lookup ID")
         
-        for obj in self._objects:
-            if obj.id == obj_id:
-                debugger.end_part("Lookup ID")
-                return ObjectList([obj])
+        obj = self._id_index().get(obj_id)
         
         debugger.end_part("Lookup ID")
-        return ObjectList([])
+        return ObjectList.unchecked([obj] if obj is not None else [])
     
     @property
     def unique_ids(self) -> set[tuple[str, str, str]]:
-        return {
-            uid
-            for obj in self._objects
-            for uid in obj.unique_ids
-        }
+        # Built on first access and kept up to date by add_object
+        if self._unique_ids is None:
+            self._unique_ids = set(chain.from_iterable(obj.unique_ids for obj in self._objects))
+        return self._unique_ids
     
     @property
     def id_types(self) -> set[tuple[str, str]]:
-        return {
-            id_type
-            for obj in self._objects
-            for id_type in obj.id_types
-        }
+        # Read after every operator that returns a list (to narrow the needed scopes), and lists
+        # like all_data or a type filter's result are returned again and again, so build it once.
+        # Callers only read it; add_object and merge drop it
+        if self._id_types is None:
+            self._id_types = set(chain.from_iterable(obj.id_types for obj in self._objects))
+        return self._id_types
 
     @property
     def types(self) -> set[str]:
-        return {
-            type
-            for obj in self._objects
-            for type in obj.types
-        }
+        # Built on first access, like id_types
+        if self._types is None:
+            self._types = set(chain.from_iterable(obj.types for obj in self._objects))
+        return self._types
     
     def add_object(self, obj: ObjectGrouping):
         uids = obj.unique_ids
-        assert uids & self.unique_ids == set(), f"Duplicate object found: {uids}"
+        unique_ids = self.unique_ids
+        assert uids.isdisjoint(unique_ids), f"Duplicate object found: {uids}"
         self._objects.append(obj)
+        unique_ids.update(uids)
+        if self._by_id is not None:
+            self._by_id.setdefault(obj.id, obj)
+        # Handed-out sets, type/source lists and field indexes are shared, so rebuild them rather than mutate them
+        self._id_types = None
+        self._types = None
+        self._by_type = None
+        self._by_source = None
+        self._by_field_value = None
     
     def __str__(self) -> str:
         max_show = 10
@@ -1,9 +1,10 @@
 from __future__ import annotations
 from abc import ABC
 from ast import List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Union, TYPE_CHECKING, Optional
 import datetime
+import sys
 
 from sa.query_language.errors import QueryError
 from sa.core.sa_types import SATypeCustom, resolve_primitive_recursively
@@ -17,6 +18,14 @@ if TYPE_CHECKING:
 @dataclass(slots=True)
 class SAObject:
     json: dict[str, 'SAType']
+    # Plain slots mirroring the meta fields of json, so the hot grouping and index loops read
+    # an attribute instead of going through a property and a dict lookup
+    types: list[str] = field(init=False, repr=False, compare=False)
+    id: str = field(init=False, repr=False, compare=False)
+    source: str = field(init=False, repr=False, compare=False)
+    # Built on first access; only set_field on a meta field changes what they're built from
+    _unique_ids: Optional[frozenset[tuple[str, str, str]]] = field(default=None, init=False, repr=False, compare=False)
+    _id_types: Optional[frozenset[tuple[str, str]]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # Check if the object is valid
@@ -27,49 +36,51 @@ class SAObject:
         assert isinstance(self.json["__id__"], str), "Object __id__ field must be a string"
         assert "__source__" in self.json, "Object must have a __source__ field"
         assert isinstance(self.json["__source__"], str), "Object __source__ field must be a string"
+        # The id, source and type names become dict keys and set members in every index, and each
+        # type name repeats across thousands of objects, so keep a single interned copy of each
+        json = self.json
+        self.types = json["__types__"] = list(map(sys.intern, json["__types__"]))
+        self.id = json["__id__"] = sys.intern(json["__id__"])
+        self.source = json["__source__"] = sys.intern(json["__source__"])
 
-    @property
-    def types(self) -> list[str]:
-        return self.json["__types__"]
-    
-    @property
-    def id(self) -> str:
-        return self.json["__id__"]
-    
-    @property
-    def source(self) -> str:
-        return self.json["__source__"]
-    
     @property
     def properties(self) -> dict[str, 'SAType']:
         return {k: resolve_primitive_recursively(v) for k, v in self.json.items() if k not in ["__types__", "__id__", "__source__"]}
     
     @property
-    def unique_ids(self) -> set[tuple[str, str, str]]:
-        return {
-            (self.id, type, self.source)
-            for type in self.types
-        }
+    def unique_ids(self) -> frozenset[tuple[str, str, str]]:
+        if self._unique_ids is None:
+            self._unique_ids = frozenset((self.id, type, self.source) for type in self.types)
+        return self._unique_ids
     
     @property
-    def id_types(self) -> set[tuple[str, str]]:
-        return {
-            (self.id, type)
-            for type in self.types
-        }
+    def id_types(self) -> frozenset[tuple[str, str]]:
+        if self._id_types is None:
+            self._id_types = frozenset((self.id, type) for type in self.types)
+        return self._id_types
     
     def set_field(self, field_name: str, value: 'SAType'):
         self.json[field_name] = value
+        if field_name in ("__types__", "__id__", "__source__"):
+            # Re-check and refresh the meta slots, and rebuild the id sets on next access
+            self.__post_init__()
+            self._unique_ids = None
+            self._id_types = None
 
     def get_field(self, field_name: str, query_state: 'QueryState') -> 'SAType':
         assert self.has_field(field_name), f"Field {field_name} not found in object {self.id}"
-        value = resolve_primitive_recursively(self.json[field_name])
+        value = self.json[field_name]
+        # Most fields are scalars, which resolve to themselves; only lists and dicts (which may
+        # hold custom types) need the recursive walk
+        if value is None or isinstance(value, (str, int, float)):
+            return value
+        value = resolve_primitive_recursively(value)
         if isinstance(value, SATypeCustom):
             return value.resolve(query_state)
         return value
     
     def has_field(self, field_name: str) -> bool:
-        return field_name in self.json.keys()
+        return field_name in self.json
     
     def empty_copy(self) -> 'SAObject':
         return SAObject({
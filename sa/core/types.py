@@ -14,15 +14,16 @@ SATypePrimitive = Union[str, int, bool, float, None, list['SATypePrimitive'], di
 # Forward reference for the main type union
 SAType = Union[SATypeCustom, SATypePrimitive]
 
+_SCALAR_TYPES = (str, int, bool, float, type(None))
+
 def is_valid_sa_type_primitive(t: any) -> bool:
-    if isinstance(t, str) or isinstance(t, int) or isinstance(t, bool) or isinstance(t, float):
+    if isinstance(t, _SCALAR_TYPES):
         return True
+    # Check scalar elements inline so long flat lists don't pay two calls per element
     if isinstance(t, list):
-        return all(is_valid_sa_type(i) for i in t)
+        return all(isinstance(i, _SCALAR_TYPES) or is_valid_sa_type(i) for i in t)
     if isinstance(t, dict):
-        return all(is_valid_sa_type(i) for i in t.values())
-    if t is None:
-        return True
+        return all(isinstance(i, _SCALAR_TYPES) or is_valid_sa_type(i) for i in t.values())
     return False
 
 def is_valid_sa_type(t: any) -> bool:
@@ -22,24 +22,18 @@ from sa.query_language.validators import is_valid_primitive, is_valid_querytype
 from dataclasses import dataclass
 
 class ParsedArguments:
-    """Container for parsed and validated arguments."""
-    
-    def __init__(self, **kwargs):
-        self._args = []
-        self._kwargs = {}
-        
-        # Separate positional and keyword arguments
-        for key, value in kwargs.items():
-            if key.startswith('arg_'):
-                # Positional argument
-                index = int(key[4:])  # Extract number from 'arg_0', 'arg_1', etc.
-                while len(self._args) <= index:
-                    self._args.append(None)
-                self._args[index] = value
-            else:
-                # Named argument
-                self._kwargs[key] = value
-    
+    """Container for parsed and validated arguments.
+
+    Each ArgumentParser builds its own subclass (see ``for_names``) whose
+    ``__slots__`` are the argument names, so ``args.field_name`` is a plain
+    slot read and positional access goes through ``_args``.
+    """
+    __slots__ = ("_args",)
+
+    @classmethod
+    def for_names(cls, names: list[str]) -> Type[ParsedArguments]:
+        return type(cls.__name__, (cls,), {"__slots__": tuple(names)})
+
     def __getitem__(self, index):
         """Allow indexing like args[0], args[1], etc."""
         return self._args[index]
@@ -51,20 +45,16 @@ class ParsedArguments:
     def __iter__(self):
         """Allow 'for arg in args' to work."""
         return iter(self._args)
-    
-    def __getattr__(self, name):
-        """Allow access to named arguments like args.field_name."""
-        if name in self._kwargs:
-            return self._kwargs[name]
-        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
 class ArgumentParser:
     """Parser for validating operator arguments with a fluent builder API."""
+    __slots__ = ("operator_name", "argument_specs", "context_spec", "parsed_arguments_cls")
     
     def __init__(self, operator_name: str):
         self.operator_name = operator_name
         self.argument_specs = []
         self.context_spec = None
+        self.parsed_arguments_cls = ParsedArguments.for_names([])
     
     def validate_context(self, type_or_validator: Union[Type, Callable], description: str):
         if isinstance(type_or_validator, type):
@@ -74,9 +64,10 @@ class ArgumentParser:
             "validator": either(type_or_validator, is_absorbing_none),
             "description": description
         }
+        return self
     
     def dont_validate_context(self):
-        self.validate_context(lambda x: True, "Context is not validated")
+        return self.validate_context(lambda x: True, "Context is not validated")
     
     def add_arg(self, type_or_validator: Union[Type, Callable], name: str, description: str):
         if isinstance(type_or_validator, type):
@@ -89,6 +80,7 @@ class ArgumentParser:
             'name': name,
             'description': description
         })
+        self.parsed_arguments_cls = ParsedArguments.for_names([spec['name'] for spec in self.argument_specs])
         return self
     
     def parse(self, context: QueryContext, arguments: Arguments, query_state: QueryState) -> ParsedArguments:
@@ -99,28 +91,44 @@ class ArgumentParser:
             else:
                 raise QueryError(f"{self.operator_name} operator can't operate on {type(context).__name__}. {self.context_spec['description']}")
 
-        if len(self.argument_specs) != len(arguments):
-            raise QueryError(f"{self.operator_name} operator expects {len(self.argument_specs)} arguments, got {len(arguments)}: {arguments}")
+        specs = self.argument_specs
+        if len(specs) != len(arguments):
+            raise QueryError(f"{self.operator_name} operator expects {len(specs)} arguments, got {len(arguments)}: {arguments}")
+
+        result = self.parsed_arguments_cls()
+        if not specs:
+            result._args = []
+            return context, result
         
-        # Run any chains if the validator doesn't like them
-        def run_chain_if_fails_validator(arg, spec):
-            if not spec['validator'](arg) and isinstance(arg, Chain):
-                return arg.run(context, query_state)
-            return arg
-        processed_args = [run_chain_if_fails_validator(arg, spec) for arg, spec in zip(arguments, self.argument_specs)]
+        # Run any chains if the validator doesn't like them, remembering which
+        # arguments already validated so each validator only runs once per value
+        processed_args = list(arguments)
+        failed_indices = []
+        for i, spec in enumerate(specs):
+            arg = processed_args[i]
+            if spec['validator'](arg):
+                continue
+            if isinstance(arg, Chain):
+                arg = arg.run(context, query_state)
+                processed_args[i] = arg
+                if spec['validator'](arg):
+                    continue
+            failed_indices.append(i)
         
-        # Build result object
-        result_kwargs = {}
-        for i, spec in enumerate(self.argument_specs):
+        for i in failed_indices:
+            spec = specs[i]
             arg = processed_args[i]
-            if not spec['validator'](arg):
-                if isinstance(arg, ObjectList) and len(arg.objects) == 1 and spec['validator'](arg.objects[0]):
-                    arg = arg.objects[0]
-                else:
-                    raise QueryError(f"{self.operator_name} operator, argument '{spec['name']}' can't be {type(arg).__name__}. {spec['description']}")
-            result_kwargs[spec['name']] = arg
+            if isinstance(arg, ObjectList) and len(arg.objects) == 1 and spec['validator'](arg.objects[0]):
+                processed_args[i] = arg.objects[0]
+            else:
+                raise QueryError(f"{self.operator_name} operator, argument '{spec['name']}' can't be {type(arg).__name__}. {spec['description']}")
+
+        # Build result object
+        for spec, arg in zip(specs, processed_args):
+            setattr(result, spec['name'], arg)
+        result._args = processed_args
             
-        return context, ParsedArguments(**result_kwargs)
+        return context, result
 
 def run_all_if_possible(context: ObjectList, arguments: Arguments, query_state: QueryState) -> list[QueryType]:
     result = []
@@ -9,12 +9,14 @@ from sa.core.object_list import ObjectList
 from sa.query_language.errors import QueryError, error_area_to_string, QueryArea
 from sa.query_language.query_state import QueryState
 
-@dataclass
+@dataclass(slots=True)
 class Operator:
     name: str
     runner: Callable[['QueryContext', 'Arguments', 'QueryState'], 'QueryType']
+    # Optionally merges a node of this operator with the node that follows it (see Chain.compile)
+    fuse_next: Optional[Callable[['OperatorNode', 'OperatorNode'], Optional['OperatorNode']]] = None
 
-@dataclass
+@dataclass(slots=True)
 class OperatorNode:
     operator: 'Operator'
     arguments: list['QueryType']
@@ -27,25 +29,31 @@ class OperatorNode:
         return f"OperatorNode({self.operator.name}, {', '.join(query_type_to_string(arg) for arg in self.arguments)})"
 
     def run(self, context: 'QueryContext', query_state: 'QueryState') -> 'QueryType':
-        try:
-            debugger.start_part("OPERATOR", str(self))
+        # Only build the debug strings when the debugger is actually recording
+        debugging = debugger.enabled
+        if debugging:
+            part_name = str(self)
+            debugger.start_part("OPERATOR", part_name)
             debugger.log("OPERATOR_ARGS", ', '.join(query_type_to_string(arg) for arg in self.arguments))
             debugger.log("OPERATOR_CONTEXT", context)
             debugger.log("OPERATOR_SCOPES_START", Scopes(query_state.final_needed_scopes))
+        try:
             result = self.operator.runner(context, self.arguments, query_state)
             if isinstance(result, ObjectList) or isinstance(result, ObjectGrouping):
                 if result.id_types:
                     query_state.needed_scopes = query_state.needed_scopes.set_id_types(result.id_types)
-            debugger.log("OPERATOR_RESULT", result)
-            debugger.log("OPERATOR_SCOPES_END", Scopes(query_state.final_needed_scopes))
-            debugger.end_part(str(self))
-            return result
         except QueryError as e:
             e.area_stack.append(self.area)
-            debugger.end_part(str(self))
+            if debugging:
+                debugger.end_part(part_name)
             raise e
+        if debugging:
+            debugger.log("OPERATOR_RESULT", result)
+            debugger.log("OPERATOR_SCOPES_END", Scopes(query_state.final_needed_scopes))
+            debugger.end_part(part_name)
+        return result
 
-@dataclass
+@dataclass(slots=True)
 class Chain:
     operator_nodes: list['OperatorNode']
 
@@ -55,7 +63,42 @@ class Chain:
     def __repr__(self):
         return f"Chain({', '.join(str(node) for node in self.operator_nodes)})"
 
+    def compile(self) -> 'Chain':
+        """Return an equivalent chain with adjacent nodes fused where their operators allow it.
+
+        Chain arguments are compiled too, so the per-object chains that filter and map run
+        are specialized once up front rather than on every object.
+        """
+        nodes: list['OperatorNode'] = []
+        for operator_node in self.operator_nodes:
+            if any(isinstance(arg, Chain) for arg in operator_node.arguments):
+                operator_node = OperatorNode(
+                    operator=operator_node.operator,
+                    arguments=[arg.compile() if isinstance(arg, Chain) else arg for arg in operator_node.arguments],
+                    area=operator_node.area
+                )
+            if nodes and nodes[-1].operator.fuse_next is not None:
+                fused = nodes[-1].operator.fuse_next(nodes[-1], operator_node)
+                if fused is not None:
+                    nodes[-1] = fused
+                    continue
+            nodes.append(operator_node)
+        return Chain(nodes)
+
     def run(self, context: 'QueryContext', query_state: 'QueryState') -> 'QueryType':
+        if debugger.enabled:
+            for operator_node in self.operator_nodes:
+                context = operator_node.run(context, query_state)
+            return context
+        # Same as OperatorNode.run without the debugger calls, inlined to save a call per node
         for operator_node in self.operator_nodes:
-            context = operator_node.run(context, query_state)
+            try:
+                context = operator_node.operator.runner(context, operator_node.arguments, query_state)
+            except QueryError as e:
+                e.area_stack.append(operator_node.area)
+                raise e
+            if isinstance(context, (ObjectList, ObjectGrouping)):
+                id_types = context.id_types
+                if id_types:
+                    query_state.needed_scopes = query_state.needed_scopes.set_id_types(id_types)
         return context
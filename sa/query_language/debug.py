@@ -67,6 +67,11 @@ class Debugger:
     def enable(self) -> None:
         """Enable the debugger. When disabled, all methods are no-ops for performance."""
         self._enabled = True
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the debugger is recording. Callers can check this to skip building expensive log arguments."""
+        return self._enabled
     
     def _get_caller_location(self) -> Optional[str]:
         """Get the file:line location of the caller."""
@@ -1,18 +1,22 @@
 from __future__ import annotations
+from collections import defaultdict
 from typing import TYPE_CHECKING
 from sa.query_language.argument_parser import ArgumentParser
 from sa.query_language.validators import is_valid_primitive
 from sa.query_language.chain import Operator
 from sa.query_language.query_state import QueryState
+from sa.core.object_list import ObjectList
 
 if TYPE_CHECKING:
     from sa.query_language.types import QueryType, Arguments, QueryContext
-    from sa.core.object_list import ObjectList
+
+_DESCRIBE_PARSER = (
+    ArgumentParser("describe")
+    .validate_context(is_valid_primitive, "Can only describe a valid query type")
+)
 
 def describe_operator_runner(context: QueryContext, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("describe")
-    parser.validate_context(is_valid_primitive)
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _DESCRIBE_PARSER.parse(context, arguments, query_state)
     
     # If input is not an ObjectList, just return str() representation
     if not isinstance(context, ObjectList):
@@ -30,10 +34,11 @@ def describe_operator_runner(context: QueryContext, arguments: Arguments, query_
     sources = set()
     
     # Analyze each object to collect types, sources, and properties
-    type_properties = {}  # type -> set of properties
-    type_sources = {}     # type -> set of sources
+    type_properties = defaultdict(set)  # type -> set of properties
+    type_sources = defaultdict(set)     # type -> set of sources
     
-    for obj in context.objects:
+    # Each grouping holds one object per source, so look at each source's object in turn
+    for obj in (sa_object for grouping in context.objects for sa_object in grouping._objects):
         obj_types = obj.types  # This is a list of types
         obj_source = obj.source
         
@@ -41,11 +46,7 @@ def describe_operator_runner(context: QueryContext, arguments: Arguments, query_
         for obj_type in obj_types:
             types.add(obj_type)
             
-            # Track properties for this type
-            if obj_type not in type_properties:
-                type_properties[obj_type] = set()
-                type_sources[obj_type] = set()
-            
+            # Track sources and properties for this type
             type_sources[obj_type].add(obj_source)
             
             # Collect all properties from this object
@@ -91,10 +92,13 @@ DescribeOperator = Operator(
     runner=describe_operator_runner
 )
 
+_SUMMARY_PARSER = (
+    ArgumentParser("summary")
+    .validate_context(is_valid_primitive, "Can only summarize a valid query type")
+)
+
 def summary_operator_runner(context: QueryContext, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("summary")
-    parser.validate_context(is_valid_primitive)
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _SUMMARY_PARSER.parse(context, arguments, query_state)
     
     # If input is not an ObjectList, just return str() representation
     if not isinstance(context, ObjectList):
@@ -112,11 +116,12 @@ def summary_operator_runner(context: QueryContext, arguments: Arguments, query_s
     sources = set()
     
     # Analyze each object to collect types, sources, and properties
-    type_properties = {}  # type -> set of properties
-    type_sources = {}     # type -> set of sources
-    property_values = {}  # property -> list of values (for variance calculation)
+    type_properties = defaultdict(set)  # type -> set of properties
+    type_sources = defaultdict(set)     # type -> set of sources
+    property_values = defaultdict(list)  # property -> list of values (for variance calculation)
     
-    for obj in context.objects:
+    # Each grouping holds one object per source, so look at each source's object in turn
+    for obj in (sa_object for grouping in context.objects for sa_object in grouping._objects):
         obj_types = obj.types  # This is a list of types
         obj_source = obj.source
         
@@ -124,11 +129,7 @@ def summary_operator_runner(context: QueryContext, arguments: Arguments, query_s
         for obj_type in obj_types:
             types.add(obj_type)
             
-            # Track properties for this type
-            if obj_type not in type_properties:
-                type_properties[obj_type] = set()
-                type_sources[obj_type] = set()
-            
+            # Track sources and properties for this type
             type_sources[obj_type].add(obj_source)
             
             # Collect all properties from this object
@@ -139,8 +140,6 @@ def summary_operator_runner(context: QueryContext, arguments: Arguments, query_s
         
         # Collect property values for variance calculation
         for prop_name, prop_value in obj.properties.items():
-            if prop_name not in property_values:
-                property_values[prop_name] = []
             property_values[prop_name].append(prop_value)
     
     # Calculate variance for each property (using unique value count as proxy for variance)
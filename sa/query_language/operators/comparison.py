@@ -13,12 +13,15 @@ if TYPE_CHECKING:
     from sa.query_language.types import QueryType, Arguments, QueryContext
     from sa.core.object_list import ObjectList
 
+_EQUALS_PARSER = (
+    ArgumentParser("equals")
+    .validate_context(anything, "")
+    .add_arg(is_valid_sa_type, "left", "Left side of equals must be a valid SA type")
+    .add_arg(is_valid_sa_type, "right", "Right side of equals must be a valid SA type")
+)
+
 def equals_operator_runner(context: ObjectList, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("equals")
-    parser.validate_context(anything, "")
-    parser.add_arg(is_valid_sa_type, "left", "Left side of equals must be a valid SA type")
-    parser.add_arg(is_valid_sa_type, "right", "Right side of equals must be a valid SA type")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _EQUALS_PARSER.parse(context, arguments, query_state)
     
     left = args.left
     right = args.right
@@ -34,12 +37,15 @@ EqualsOperator = Operator(
     runner=equals_operator_runner
 )
 
+_REGEX_EQUALS_PARSER = (
+    ArgumentParser("regex_equals")
+    .validate_context(anything, "")
+    .add_arg(str, "left", "Left side of regex equals must be a string")
+    .add_arg(str, "right", "Right side of regex equals must be a string")
+)
+
 def regex_equals_operator_runner(context: ObjectList, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("regex_equals")
-    parser.add_arg(str, "left", "Left side of regex equals must be a string")
-    parser.add_arg(str, "right", "Right side of regex equals must be a string")
-    parser.validate_context(anything, "")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _REGEX_EQUALS_PARSER.parse(context, arguments, query_state)
     
     left = args.left
 
@@ -7,55 +7,83 @@ from sa.query_language.errors import QueryError
 from sa.query_language.types import AbsorbingNone
 from sa.query_language.chain import Operator
 from sa.core.object_grouping import ObjectGrouping
+from sa.core.object_list import ObjectList
 from sa.query_language.query_state import QueryState
 
 if TYPE_CHECKING:
     from sa.query_language.types import QueryType, Arguments, QueryContext
-    from sa.core.object_list import ObjectList
+
+_GET_FIELD_PARSER = (
+    ArgumentParser("get_field")
+    .validate_context(either(is_object_grouping, is_dict), "You can only use the get_field operator on an individual object or dicts.")
+    .add_arg(str, "field_name", "The field to get must be a string.")
+    .add_arg(bool, "return_none_if_missing", "Please specify whether to return None if the field is missing.")
+    .add_arg(bool, "return_all_values", "Please specify whether to return all values for the field from all sources.")
+)
 
 def get_field_operator_runner(context: QueryType, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("get_field")
-    parser.add_arg(str, "field_name", "The field to get must be a string.")
-    parser.add_arg(bool, "return_none_if_missing", "Please specify whether to return None if the field is missing.")
-    parser.add_arg(bool, "return_all_values", "Please specify whether to return all values for the field from all sources.")
-    parser.validate_context(either(is_object_grouping, is_dict), "You can only use the get_field operator on an individual object or dicts.")
-    context, args = parser.parse(context, arguments, query_state)
-    
-    # Filter needed_scopes to only include scopes that have the requested field
-    query_state.needed_scopes = query_state.needed_scopes.filter_fields([args.field_name])
+    # Fast path for the .field shorthand on one object, which filter runs for every object it checks:
+    # the parser emits literal (str, bool, bool) arguments, so there's nothing to validate or evaluate
+    if isinstance(context, ObjectList) and len(context.objects) == 1:
+        context = context.objects[0]
+    if type(context) is ObjectGrouping and len(arguments) == 3 and type(arguments[0]) is str and type(arguments[1]) is bool and type(arguments[2]) is bool:
+        return get_grouping_field(context, arguments[0], arguments[1], arguments[2], query_state)
+
+    context, args = _GET_FIELD_PARSER.parse(context, arguments, query_state)
 
     if isinstance(context, dict):
+        # Filter needed_scopes to only include scopes that have the requested field
+        query_state.needed_scopes = query_state.needed_scopes.filter_fields([args.field_name])
         if not args.field_name in context:
             if args.return_none_if_missing:
                 return AbsorbingNone
             raise QueryError(f"Field '{args.field_name}' not found in dict: {context}", could_succeed_with_more_data=True)
         return context[args.field_name]
-    
-    object_grouping = context
 
-    if object_grouping is AbsorbingNone:
+    if context is AbsorbingNone:
+        # The parser lets AbsorbingNone through; the fast path and filter only pass real groupings
+        query_state.needed_scopes = query_state.needed_scopes.filter_fields([args.field_name])
         return AbsorbingNone
 
-    if args.return_all_values:
-        return object_grouping.get_all_field_values(args.field_name, query_state)
+    return get_grouping_field(context, args.field_name, args.return_none_if_missing, args.return_all_values, query_state)
 
-    if not object_grouping.has_field(args.field_name):
-        if args.return_none_if_missing:
+def get_grouping_field(object_grouping: ObjectGrouping, field_name: str, return_none_if_missing: bool, return_all_values: bool, query_state: QueryState) -> QueryType:
+    # Filter needed_scopes to only include scopes that have the requested field
+    query_state.needed_scopes = query_state.needed_scopes.filter_fields([field_name])
+
+    if return_all_values:
+        return object_grouping.get_all_field_values(field_name, query_state)
+
+    if not object_grouping.has_field(field_name):
+        if return_none_if_missing:
             return AbsorbingNone
-        raise QueryError(f"Field '{args.field_name}' not found in object: {object_grouping}", could_succeed_with_more_data=True)
+        raise QueryError(f"Field '{field_name}' not found in object: {object_grouping}", could_succeed_with_more_data=True)
 
-    return object_grouping.get_field(args.field_name, query_state)
+    # The grouping memoizes scalar fields itself, so repeated reads within and across queries are cheap
+    return object_grouping.get_field(field_name, query_state)
+
+def is_plain_field(object_grouping: ObjectGrouping, field_name: str) -> bool:
+    """Whether a field only holds scalars, so reading it doesn't depend on the query state."""
+    if object_grouping._field_overrides:
+        return False
+    for obj in object_grouping._objects:
+        if isinstance(obj.json.get(field_name), (list, dict)):
+            return False
+    return True
 
 GetFieldOperator = Operator(
     name="get_field",
     runner=get_field_operator_runner
 )
 
+_HAS_FIELD_PARSER = (
+    ArgumentParser("has_field")
+    .validate_context(either(is_single_object_list, is_object_grouping, is_dict), "You can only use the has_field operator on an individual object or dicts.")
+    .add_arg(str, "field_name", "The field to check must be a string.")
+)
+
 def has_field_operator_runner(context: QueryType, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("has_field")
-    parser.add_arg(str, "field_name", "The field to check must be a string.")
-    parser.validate_context(either(is_single_object_list, is_object_grouping, is_dict), "You can only use the has_field operator on an individual object or dicts.")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _HAS_FIELD_PARSER.parse(context, arguments, query_state)
     
     if isinstance(context, dict):
         return args.field_name in context
@@ -1,12 +1,16 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Optional
+import itertools
+import re
 from sa.query_language.debug import debugger
 from sa.query_language.scopes import Scopes, chain_to_condition
 from sa.query_language.argument_parser import ArgumentParser, run_all_if_possible
 from sa.query_language.validators import is_object_list, is_list, either, is_object_grouping, is_dict, is_string
-from sa.query_language.errors import QueryError, assert_query
+from sa.query_language.errors import QueryError, QueryArea, assert_query
 from sa.query_language.types import AbsorbingNone, AbsorbingNoneType
-from sa.query_language.chain import Operator, Chain
+from sa.query_language.chain import Operator, OperatorNode, Chain
+from sa.query_language.operators.comparison import EqualsOperator, RegexEqualsOperator
+from sa.query_language.operators.field_operations import GetFieldOperator, get_grouping_field, is_plain_field
 from sa.query_language.utils import flatten_fully
 from sa.core.object_list import ObjectList
 from sa.core.object_grouping import ObjectGrouping
@@ -16,11 +20,19 @@ from sa.query_language.query_state import QueryState
 if TYPE_CHECKING:
     from sa.query_language.types import QueryType, Arguments, QueryContext
 
-def filter_operator_runner(context: QueryContext, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("filter")
-    parser.add_arg(Chain, "chain", "The filtering expression must be able to be evaluated on each object to a boolean.")
-    parser.validate_context(either(is_object_list, is_list), "You can use the filter operator on an ObjectList or a regular list.")
-    context, args = parser.parse(context, arguments, query_state)
+_FILTER_PARSER = (
+    ArgumentParser("filter")
+    .validate_context(either(is_object_list, is_list), "You can use the filter operator on an ObjectList or a regular list.")
+    .add_arg(Chain, "chain", "The filtering expression must be able to be evaluated on each object to a boolean.")
+)
+
+def filter_operator_runner(context: QueryContext, arguments: Arguments, query_state: QueryState, selected_fields: Optional[set[str]] = None) -> QueryType:
+    """Filter a list or ObjectList by a chain.
+
+    If selected_fields is given, surviving groupings are narrowed to those fields as they're
+    collected, which is what a fused filter + select node runs (see filter_select_operator_runner).
+    """
+    context, args = _FILTER_PARSER.parse(context, arguments, query_state)
 
     condition = chain_to_condition(args.chain)
     if condition:
@@ -31,11 +43,24 @@ def filter_operator_runner(context: QueryContext, arguments: Arguments, query_st
 
     debugger.start_part("FILTER", "Filtering objects")
     
+    fresh_scopes = Scopes.setup(query_state.all_scopes)
     if isinstance(context, ObjectList):
+        equals_literal = match_field_comparison(args.chain, EqualsOperator, commutative=True) if not debugger.enabled else None
+        if equals_literal is not None:
+            matches = lookup_field_equals_literal(equals_literal, context)
+            if matches is not None:
+                debugger.end_part("Filtering objects")
+                if selected_fields is not None:
+                    matches = [grouped_object.select_fields(selected_fields) for grouped_object in matches]
+                return ObjectList.unchecked(matches)
+        predicate = compile_filter_predicate(args.chain) if not debugger.enabled else None
         survivors: list[ObjectGrouping] = []
-        for i, grouped_object in enumerate(context.objects):
-            new_state = QueryState.setup(query_state.providers)
-            chain_result = args.chain.run(ObjectList([grouped_object]), new_state)
+        for grouped_object in context.objects:
+            new_state = QueryState.setup(query_state.providers, fresh_scopes)
+            if predicate is not None:
+                chain_result = predicate(grouped_object, new_state)
+            else:
+                chain_result = args.chain.run(ObjectList.unchecked([grouped_object]), new_state)
             # query_state.staged_scopes.scopes.update(new_state.final_needed_scopes)
             # TODO: Implement once we have proper named contexts
 
@@ -47,14 +72,16 @@ def filter_operator_runner(context: QueryContext, arguments: Arguments, query_st
                 raise QueryError(f"Filter expression for {grouped_object} result must be a boolean, got {type(chain_result).__name__}: {chain_result}")
             
             if chain_result:
-                survivors.append(grouped_object)
+                survivors.append(grouped_object if selected_fields is None else grouped_object.select_fields(selected_fields))
         
         debugger.end_part("Filtering objects")
-        return ObjectList(survivors)
+        # Always a new list, even when every grouping survives: the input may be all_data, which
+        # a scope download grows in place, and the result must not change after it's returned
+        return ObjectList.unchecked(survivors)
     else:  # Regular Python list
         survivors = []
         for item in context:
-            new_state = QueryState.setup(query_state.providers)
+            new_state = QueryState.setup(query_state.providers, fresh_scopes)
             chain_result = args.chain.run(item, new_state)
 
             if isinstance(chain_result, AbsorbingNoneType):
@@ -70,19 +97,143 @@ def filter_operator_runner(context: QueryContext, arguments: Arguments, query_st
         debugger.end_part("Filtering objects")
         return survivors
 
+FieldComparison = tuple[OperatorNode, OperatorNode, str, bool, SAType]
+FilterPredicate = Callable[[ObjectGrouping, QueryState], "QueryType"]
+
+def match_field_comparison(chain: Chain, operator: Operator, commutative: bool = False) -> Optional[FieldComparison]:
+    """Match the [.field <operator> literal] filter shape, returning (comparison_node, get_field_node, field_name, return_none_if_missing, literal).
+
+    With commutative, [literal <operator> .field] matches too.
+    """
+    if len(chain.operator_nodes) != 1:
+        return None
+    comparison_node = chain.operator_nodes[0]
+    if comparison_node.operator is not operator or len(comparison_node.arguments) != 2:
+        return None
+    left, right = comparison_node.arguments
+    if commutative and isinstance(right, Chain):
+        left, right = right, left
+    if not isinstance(left, Chain) or len(left.operator_nodes) != 1:
+        return None
+    if not isinstance(right, (str, int, float, bool)):
+        return None
+    get_field_node = left.operator_nodes[0]
+    if get_field_node.operator is not GetFieldOperator:
+        return None
+    field_args = get_field_node.arguments
+    if len(field_args) != 3 or type(field_args[0]) is not str or type(field_args[1]) is not bool or field_args[2] is not False:
+        return None
+    return comparison_node, get_field_node, field_args[0], field_args[1], right
+
+def read_compared_field(comparison: FieldComparison, object_grouping: ObjectGrouping, query_state: QueryState) -> QueryType:
+    """Read the field of a matched comparison from a plain field, with the error areas running the chain would give."""
+    comparison_node, get_field_node, field_name, return_none_if_missing, _ = comparison
+    try:
+        return get_grouping_field(object_grouping, field_name, return_none_if_missing, False, query_state)
+    except QueryError as e:
+        e.area_stack.append(get_field_node.area)
+        e.area_stack.append(comparison_node.area)
+        raise e
+
+def compile_filter_predicate(chain: Chain) -> Optional[FilterPredicate]:
+    """Specialize a filter chain into a closure with its field name and literal bound up front.
+
+    Handles [.field == literal] (either way round) and [.field =~ 'pattern'] (with the pattern
+    compiled once).
+    Groupings the closure can't evaluate directly, such as non-scalar fields, run the chain as usual,
+    so results, scope updates and errors match Chain.run.
+    """
+    equals = match_field_comparison(chain, EqualsOperator, commutative=True)
+    if equals is not None:
+        field_name, literal = equals[2], equals[4]
+
+        def field_equals_literal(object_grouping: ObjectGrouping, query_state: QueryState) -> QueryType:
+            if not is_plain_field(object_grouping, field_name):
+                return chain.run(ObjectList.unchecked([object_grouping]), query_state)
+            value = read_compared_field(equals, object_grouping, query_state)
+            if value is AbsorbingNone:
+                return AbsorbingNone
+            return value == literal
+        return field_equals_literal
+
+    regex_equals = match_field_comparison(chain, RegexEqualsOperator)
+    if regex_equals is not None and isinstance(regex_equals[4], str):
+        field_name = regex_equals[2]
+        try:
+            pattern = re.compile(regex_equals[4])
+        except re.error:
+            # Let regex_equals report the invalid pattern
+            return None
+
+        def field_matches_pattern(object_grouping: ObjectGrouping, query_state: QueryState) -> QueryType:
+            if not is_plain_field(object_grouping, field_name):
+                return chain.run(ObjectList.unchecked([object_grouping]), query_state)
+            value = read_compared_field(regex_equals, object_grouping, query_state)
+            if type(value) is not str:
+                # Missing and non-string values go through regex_equals for its checks
+                return chain.run(ObjectList.unchecked([object_grouping]), query_state)
+            return bool(pattern.search(value))
+        return field_matches_pattern
+
+    return None
+
+def lookup_field_equals_literal(predicate: FieldComparison, object_list: ObjectList) -> Optional[list[ObjectGrouping]]:
+    """Answer a matched [.field == literal] predicate from the list's field value index.
+
+    Returns the matching groupings in list order, or None if the predicate has to be evaluated
+    per grouping: the index can't be built, or a grouping lacks the field and .field! would raise.
+    """
+    _, _, field_name, return_none_if_missing, literal = predicate
+    index = object_list.field_value_index(field_name)
+    if index is None:
+        return None
+    buckets, has_missing = index
+    if has_missing and not return_none_if_missing:
+        return None
+    return list(buckets.get(literal, ()))
+
+def filter_select_operator_runner(context: QueryContext, arguments: Arguments, query_state: QueryState) -> QueryType:
+    # Fused filter(chain) followed by select(field, ...) with constant field names
+    chain, fields = arguments[0], arguments[1:]
+    if not isinstance(context, ObjectList):
+        filtered = filter_operator_runner(context, [chain], query_state)
+        return select_operator_runner(filtered, fields, query_state)
+    filtered = filter_operator_runner(context, [chain], query_state, selected_fields=set(fields))
+    query_state.needed_scopes = query_state.needed_scopes.filter_fields(fields)
+    return filtered
+
+FilterSelectOperator = Operator(
+    name="filter_select",
+    runner=filter_select_operator_runner
+)
+
+def fuse_filter_with_next(filter_node: OperatorNode, next_node: OperatorNode) -> Optional[OperatorNode]:
+    """Fuse a filter with a following select over constant field names, so survivors are narrowed in the same pass."""
+    if next_node.operator is not SelectOperator or len(filter_node.arguments) != 1:
+        return None
+    if not next_node.arguments or not all(isinstance(arg, str) for arg in next_node.arguments):
+        return None
+    area = QueryArea(filter_node.area.start_index, next_node.area.end_index, filter_node.area.terms, filter_node.area.all_tokens)
+    return OperatorNode(operator=FilterSelectOperator, arguments=[*filter_node.arguments, *next_node.arguments], area=area)
+
 FilterOperator = Operator(
     name="filter",
-    runner=filter_operator_runner
+    runner=filter_operator_runner,
+    fuse_next=fuse_filter_with_next
+)
+
+_MAP_PARSER = (
+    ArgumentParser("map")
+    .validate_context(either(is_object_list, is_list), "You can use the map operator on an ObjectList or a regular list.")
+    .add_arg(Chain, "chain", "The mapping expression must be able to be evaluated on each object to a value.")
 )
 
 def map_operator_runner(context: QueryContext, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("map")
-    parser.add_arg(Chain, "chain", "The mapping expression must be able to be evaluated on each object to a value.")
-    parser.validate_context(either(is_object_list, is_list), "You can use the map operator on an ObjectList or a regular list.")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _MAP_PARSER.parse(context, arguments, query_state)
     
+    fresh_scopes = Scopes.setup(query_state.all_scopes)
     if isinstance(context, ObjectList):
-        results = [args.chain.run(obj, QueryState.setup(query_state.providers)) for obj in context.objects]
+        results = [args.chain.run(obj, QueryState.setup(query_state.providers, fresh_scopes)) for obj in context.objects]
         # TODO: Implement once we have proper named contexts
         results = [res for res in results if not isinstance(res, AbsorbingNoneType)]
         if len(results) == 0:
@@ -91,7 +242,7 @@ def map_operator_runner(context: QueryContext, arguments: Arguments, query_state
             return ObjectList(results)
         return results
     else:  # Regular Python list
-        results = [args.chain.run(item, QueryState.setup(query_state.providers)) for item in context]
+        results = [args.chain.run(item, QueryState.setup(query_state.providers, fresh_scopes)) for item in context]
         results = [res for res in results if not isinstance(res, AbsorbingNoneType)]
         return results
 
@@ -126,34 +277,38 @@ def select_operator_runner(context: ObjectList, arguments: Arguments, query_stat
         if not isinstance(arg, str):
             raise QueryError(f"Select arguments must be strings, got {type(arg)}: {arg}")
     
+    # The selected field set doesn't depend on the object, so build it once for every lookup below
+    fields = set(arguments)
+
     # Filter needed_scopes to only include scopes that have the selected fields
-    query_state.needed_scopes = query_state.needed_scopes.filter_fields(arguments)
+    query_state.needed_scopes = query_state.needed_scopes.filter_fields(fields)
 
     if isinstance(context, dict):
         return {
-            k: v for k, v in context.items() if k in arguments
+            k: v for k, v in context.items() if k in fields
         }
     
     if isinstance(context, ObjectGrouping):
-        return context.select_fields(set(arguments))
+        return context.select_fields(fields)
     
     if isinstance(context, ObjectList):
-        # Note: select_fields creates new ObjectGrouping instances, so we can't directly reuse cache
-        # But we can still create a filtered cache for the original objects for potential future use
-        selected_objects = [obj.select_fields(set(arguments)) for obj in context.objects]
-        # Since select_fields creates new objects, we can't reuse the cache directly
-        return ObjectList(selected_objects)
+        # select_fields copies each grouping (sharing its cached id sets) and never mutates the field set
+        selected_objects = [obj.select_fields(fields) for obj in context.objects]
+        return ObjectList.unchecked(selected_objects)
 
 SelectOperator = Operator(
     name="select",
     runner=select_operator_runner
 )
 
+_INCLUDES_PARSER = (
+    ArgumentParser("includes")
+    .validate_context(either(is_list, is_string), "Includes must be called on a list or string.")
+    .add_arg(str, "value", "The value to search for must be a string.")
+)
+
 def includes_operator_runner(context: SAType, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("includes")
-    parser.add_arg(str, "value", "The value to search for must be a string.")
-    parser.validate_context(either(is_list, is_string), "Includes must be called on a list or string.")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _INCLUDES_PARSER.parse(context, arguments, query_state)
     return args.value in context
 
 IncludesOperator = Operator(
@@ -161,10 +316,13 @@ IncludesOperator = Operator(
     runner=includes_operator_runner
 )
 
+_FLATTEN_PARSER = (
+    ArgumentParser("flatten")
+    .validate_context(is_list, "Flatten must be called on a list.")
+)
+
 def flatten_operator_runner(context: SAType, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("flatten")
-    parser.validate_context(is_list, "Flatten must be called on a list.")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _FLATTEN_PARSER.parse(context, arguments, query_state)
     
     if len(context) == 0:
         return []
@@ -172,20 +330,23 @@ def flatten_operator_runner(context: SAType, arguments: Arguments, query_state:
     if not all(isinstance(item, list) for item in context):
         return context
     
-    result = [item for sublist in context for item in sublist]
-    return result
+    return list(itertools.chain.from_iterable(context))
 
 FlattenOperator = Operator(
     name="flatten",
     runner=flatten_operator_runner
 )
 
+_UNIQUE_PARSER = (
+    ArgumentParser("unique")
+    .validate_context(is_list, "Requires list")
+)
+
 def unique_operator_runner(context: SAType, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("unique")
-    parser.validate_context(is_list, "Requires list")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _UNIQUE_PARSER.parse(context, arguments, query_state)
     
-    unique_items = list(set(context))
+    # dict.fromkeys dedupes in one pass and keeps first-seen order
+    unique_items = list(dict.fromkeys(context))
     
     return unique_items
 
@@ -11,11 +11,15 @@ if TYPE_CHECKING:
     from sa.query_language.types import QueryType, Arguments, QueryContext
     from sa.core.object_list import ObjectList
 
+_AND_PARSER = (
+    ArgumentParser("and")
+    .validate_context(anything, "")
+    .add_arg(is_valid_sa_type, "left", "Left side of and must be a valid SA type")
+    .add_arg(is_valid_sa_type, "right", "Right side of and must be a valid SA type")
+)
+
 def and_operator_runner(context: ObjectList, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("and")
-    parser.add_arg(is_valid_sa_type, "left")
-    parser.add_arg(is_valid_sa_type, "right")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _AND_PARSER.parse(context, arguments, query_state)
     
     left = args.left
     right = args.right
@@ -31,11 +35,15 @@ AndOperator = Operator(
     runner=and_operator_runner
 )
 
+_OR_PARSER = (
+    ArgumentParser("or")
+    .validate_context(anything, "")
+    .add_arg(is_valid_sa_type, "left", "Left side of or must be a valid SA type")
+    .add_arg(is_valid_sa_type, "right", "Right side of or must be a valid SA type")
+)
+
 def or_operator_runner(context: ObjectList, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("or")
-    parser.add_arg(is_valid_sa_type, "left")
-    parser.add_arg(is_valid_sa_type, "right")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _OR_PARSER.parse(context, arguments, query_state)
     
     left = args.left
     right = args.right
@@ -51,12 +59,15 @@ OrOperator = Operator(
     runner=or_operator_runner
 )
 
+_ADD_PARSER = (
+    ArgumentParser("add")
+    .validate_context(anything, "")
+    .add_arg(is_valid_sa_type, "left", "Left side of add must be a valid SA type")
+    .add_arg(is_valid_sa_type, "right", "Right side of add must be a valid SA type")
+)
+
 def add_operator_runner(context: QueryContext, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("add")
-    parser.add_arg(is_valid_sa_type, "left", "Left side of add must be a valid SA type")
-    parser.add_arg(is_valid_sa_type, "right", "Right side of add must be a valid SA type")
-    parser.validate_context(anything, "")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _ADD_PARSER.parse(context, arguments, query_state)
     
     left = args.left
     right = args.right
@@ -11,11 +11,14 @@ from sa.query_language.query_state import QueryState
 if TYPE_CHECKING:
     from sa.query_language.types import QueryType, Arguments, QueryContext
 
+_GET_BY_ID_PARSER = (
+    ArgumentParser("get_by_id")
+    .validate_context(is_object_list, "You can only use the get_by_id operator on an ObjectList.")
+    .add_arg(str, "obj_id", "The ID to search for must be a string.")
+)
+
 def get_by_id_operator_runner(context: ObjectList, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("get_by_id")
-    parser.add_arg(str, "obj_id", "The ID to search for must be a string.")
-    parser.validate_context(is_object_list, "You can only use the get_by_id operator on an ObjectList.")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _GET_BY_ID_PARSER.parse(context, arguments, query_state)
     
     return context.get_by_id(args.obj_id)
 
@@ -24,11 +27,14 @@ GetByIdOperator = Operator(
     runner=get_by_id_operator_runner
 )
 
+_FILTER_BY_TYPE_PARSER = (
+    ArgumentParser("filter_by_type")
+    .validate_context(is_object_list, "You can only use the filter_by_type operator on an ObjectList.")
+    .add_arg(str, "type_name", "The type to filter by must be a string.")
+)
+
 def filter_by_type_operator_runner(context: ObjectList, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("filter_by_type")
-    parser.add_arg(str, "type_name", "The type to filter by must be a string.")
-    parser.validate_context(is_object_list, "You can only use the filter_by_type operator on an ObjectList.")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _FILTER_BY_TYPE_PARSER.parse(context, arguments, query_state)
 
     # Filter needed_scopes to only include scopes with the specified type
     query_state.needed_scopes = query_state.needed_scopes.filter_type(args.type_name)
@@ -40,11 +46,14 @@ FilterByTypeOperator = Operator(
     runner=filter_by_type_operator_runner
 )
 
+_FILTER_BY_SOURCE_PARSER = (
+    ArgumentParser("filter_by_source")
+    .validate_context(either(is_object_list, is_object_grouping), "You can only use the filter_by_source operator on an ObjectList or ObjectGrouping.")
+    .add_arg(str, "source_name", "The source to filter by must be a string.")
+)
+
 def filter_by_source_operator_runner(context: ObjectList, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("filter_by_source")
-    parser.add_arg(str, "source_name", "The source to filter by must be a string.")
-    parser.validate_context(either(is_object_list, is_object_grouping), "You can only use the filter_by_source operator on an ObjectList or ObjectGrouping.")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _FILTER_BY_SOURCE_PARSER.parse(context, arguments, query_state)
 
     if isinstance(context, ObjectGrouping):
         result = context.select_sources(args.source_name)
@@ -52,11 +61,8 @@ def filter_by_source_operator_runner(context: ObjectList, arguments: Arguments,
             return AbsorbingNone
         return result
     
-    filtered = context.filter_by_source(args.source_name)
-    selected = [obj.select_sources(args.source_name) for obj in filtered.objects]
-    selected = [obj for obj in selected if obj is not None]
-    # Note: select_sources creates new ObjectGrouping instances, so we can't directly reuse cache
-    return ObjectList(selected)
+    # The groupings are already narrowed to the source
+    return context.filter_by_source(args.source_name)
 
 FilterBySourceOperator = Operator(
     name="filter_by_source",
@@ -38,7 +38,7 @@ def slice_operator_runner(context: QueryContext, arguments: Arguments, query_sta
     
     # Return appropriate type based on input context
     if isinstance(context, ObjectList) and not isinstance(result_items, ObjectGrouping):
-        return ObjectList(result_items)
+        return ObjectList.unchecked(result_items)
     else:
         return result_items
 
@@ -12,11 +12,14 @@ if TYPE_CHECKING:
     from sa.query_language.types import QueryType, Arguments, QueryContext
     from sa.core.object_list import ObjectList
 
+_SHOW_PLAN_PARSER = (
+    ArgumentParser("show_plan")
+    .validate_context(anything, "")
+    .add_arg(Chain, "chain", "The chain to show the plan for")
+)
+
 def show_plan_operator_runner(context: ObjectList, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("show_plan")
-    parser.add_arg(Chain, "chain", "The chain to show the plan for")
-    parser.validate_context(anything, "")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _SHOW_PLAN_PARSER.parse(context, arguments, query_state)
     return f"Chain({args.chain}) {query_state.needed_scopes}"
 
 ShowPlanOperator = Operator(
@@ -24,10 +27,13 @@ ShowPlanOperator = Operator(
     runner=show_plan_operator_runner
 )
 
+_TO_JSON_PARSER = (
+    ArgumentParser("to_json")
+    .validate_context(either(is_object_list, is_object_grouping), "Can only use to_json operator on a valid query type")
+)
+
 def to_json_operator_runner(context: QueryType, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("to_json")
-    parser.validate_context(either(is_object_list, is_object_grouping), "Can only use to_json operator on a valid query type")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _TO_JSON_PARSER.parse(context, arguments, query_state)
     
     if isinstance(context, ObjectList):
         return [obj.json for group in context._objects for obj in group._objects]
@@ -39,10 +45,13 @@ ToJsonOperator = Operator(
     runner=to_json_operator_runner
 )
 
+_COUNT_PARSER = (
+    ArgumentParser("count")
+    .validate_context(either(is_object_list, is_list), "Can only count ObjectList or list items")
+)
+
 def count_operator_runner(context: QueryContext, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("count")
-    parser.validate_context(either(is_object_list, is_list), "Can only count ObjectList or list items")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _COUNT_PARSER.parse(context, arguments, query_state)
     
     if isinstance(context, ObjectList):
         count = len(context.objects)
@@ -57,10 +66,13 @@ CountOperator = Operator(
     runner=count_operator_runner
 )
 
+_ANY_PARSER = (
+    ArgumentParser("any")
+    .validate_context(is_valid_primitive, "Can only use any operator on a valid query type")
+)
+
 def any_operator_runner(context: QueryContext, arguments: Arguments, query_state: QueryState) -> QueryType:
-    parser = ArgumentParser("any")
-    parser.validate_context(is_valid_primitive)
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _ANY_PARSER.parse(context, arguments, query_state)
     
     if isinstance(context, ObjectList):
         result = len(context.objects) > 0
@@ -80,12 +92,15 @@ AnyOperator = Operator(
 )
 
 
+_TYPES_PARSER = (
+    ArgumentParser("types")
+    .validate_context(is_object_list, "Can only use types operator on an ObjectList")
+)
+
 def types_operator_runner(context: QueryContext, arguments: Arguments, query_state: QueryState) -> QueryType:
     # just returns all the types in the context, deduplicated
     # context should be an ObjectList
-    parser = ArgumentParser("types")
-    parser.validate_context(is_object_list, "Can only use types operator on an ObjectList")
-    context, args = parser.parse(context, arguments, query_state)
+    context, args = _TYPES_PARSER.parse(context, arguments, query_state)
     
     context: ObjectList = context
     return list(context.types)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Union
+from functools import lru_cache
+import re
 import sys
 from sa.query_language.debug import debugger
 from sa.core.object_list import ObjectList
@@ -20,28 +22,13 @@ from sa.query_language.operators.slice import SliceOperator
 Tokens = list[str]
 
 
+# One token per match: a run of word characters, a negative sign glued to the word after it
+# (only where a minus operator can't appear, i.e. not after a word, `]` or `)`), or any other
+# single character.
+TOKEN_PATTERN = re.compile(r"(?<![\w\])])-\w*|\w+|.", re.DOTALL)
+
 def get_tokens_from_query(query: str) -> Tokens:
-    tokens = []
-    current_alphanumeric = ''
-    
-    for i, char in enumerate(query):
-        if char.isalnum() or char == '_':
-            current_alphanumeric += char
-        else:
-            if current_alphanumeric:
-                tokens.append(current_alphanumeric)
-                current_alphanumeric = ''
-            
-            # Handle negative numbers
-            if char == '-' and (i == 0 or not query[i-1].isalnum() and query[i-1] != '_' and query[i-1] != ']' and query[i-1] != ')'):
-                # This is a negative sign, not a minus operator
-                current_alphanumeric = '-'
-            else:
-                tokens.append(char)
-    
-    # Don't forget the last alphanumeric sequence
-    if current_alphanumeric:
-        tokens.append(current_alphanumeric)
+    tokens = TOKEN_PATTERN.findall(query)
 
     assert_query("".join(tokens) == query, f"Expected query to be the same, got {query} and {''.join(tokens)}")
     
@@ -58,7 +45,7 @@ def parse_string_literal(tokens: Tokens, start_index: int) -> tuple[str, int]:
             break
         final_str += token
         scan_index += 1
-    return final_str, scan_index
+    return sys.intern(final_str), scan_index
 
 def accumulate_identifier_tokens(tokens: Tokens, start_index: int, allowed_chars: str = "alnum_-") -> tuple[str, int]:
     """Accumulate consecutive tokens based on allowed character types.
@@ -256,7 +243,8 @@ def parse_tokens_into_querytype(all_tokens: Tokens, tokens: Tokens, area: QueryA
                     else:
                         accumulated_field, next_index = accumulate_identifier_tokens(tokens, current_token_index + 1, "alnum_-*")
                         # Convert * to .* for regex wildcard matching
-                        field = accumulated_field.replace("*", ".*")
+                        # Interned to match the interned keys of downloaded objects
+                        field = sys.intern(accumulated_field.replace("*", ".*"))
 
                     return_none_if_missing = True
                     if len(tokens) > next_index and tokens[next_index] == "!":
@@ -417,15 +405,41 @@ def parse_query_into_querytype(query: str) -> QueryType:
         raise e
     return result
 
+@lru_cache(maxsize=512)
+def parse_and_compile_query(query: str) -> QueryType:
+    """Parse a query and compile it if it's a chain, caching the result by query string.
+
+    Parsed queries are never mutated when run, so the same one can be reused by every
+    execution attempt in execute_query_fully and by repeated queries in the shell.
+    """
+    parsed_query = parse_query_into_querytype(query)
+    if isinstance(parsed_query, Chain):
+        return parsed_query.compile()
+    return parsed_query
+
+def query_reads_data(query: str) -> bool:
+    """Whether running a query can touch provider data at all.
+
+    Literal queries evaluate to themselves and queries that fail to parse never run, so callers can
+    skip fetching data for them. Anything unexpected is assumed to need data.
+    """
+    try:
+        return isinstance(parse_and_compile_query(query), Chain)
+    except QueryError:
+        return False
+    except Exception:
+        return True
+
 def run_query(query: str, query_state: QueryState) -> QueryType:
     debugger.start_part("QUERY", f"Run query")
-    debugger.log("QUERY", query)
-    debugger.log("QUERY_ALL_SCOPES", Scopes(query_state.all_scopes))
-    debugger.log("QUERY_START_SCOPES", Scopes(query_state.final_needed_scopes))
-    debugger.log("QUERY_DOWNLOADED_SCOPES", Scopes(query_state.providers.downloaded_scopes))
+    if debugger.enabled:
+        debugger.log("QUERY", query)
+        debugger.log("QUERY_ALL_SCOPES", Scopes(query_state.all_scopes))
+        debugger.log("QUERY_START_SCOPES", Scopes(query_state.final_needed_scopes))
+        debugger.log("QUERY_DOWNLOADED_SCOPES", Scopes(query_state.providers.downloaded_scopes))
     try:
         debugger.start_part("PARSE", "Parse query")
-        parsed_query = parse_query_into_querytype(query)
+        parsed_query = parse_and_compile_query(query)
         debugger.end_part("Parse query")
         if isinstance(parsed_query, Chain):
             debugger.start_part("CHAIN", "Execute chain")
@@ -438,8 +452,9 @@ def run_query(query: str, query_state: QueryState) -> QueryType:
     except QueryError as e:
         debugger.end_part(f"Run query")
         return e
-    debugger.log("QUERY_RESULT", result)
-    debugger.log("QUERY_SCOPES", Scopes(query_state.final_needed_scopes))
+    if debugger.enabled:
+        debugger.log("QUERY_RESULT", result)
+        debugger.log("QUERY_SCOPES", Scopes(query_state.final_needed_scopes))
     debugger.end_part(f"Run query")
     return result
 
@@ -478,7 +493,8 @@ def execute_query_fully(query: str, providers: Providers) -> Union[QueryType, Qu
 
         # Each time, download all the missing scopes
         debugger.start_part("SCOPES_DOWNLOAD", f"Downloading missing scopes")
-        debugger.log("MISSING_SCOPES", Scopes(missing_scopes))
+        if debugger.enabled:
+            debugger.log("MISSING_SCOPES", Scopes(missing_scopes))
         made_progress = False
         for scope in missing_scopes:
             if scope in failed_scopes:
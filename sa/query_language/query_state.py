@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import Optional
 from sa.core.scope import Scope
 from sa.shell.provider_manager import Providers
 from sa.core.object_list import ObjectList
@@ -26,8 +27,10 @@ class QueryState:
         return self.staged_scopes.scopes | self.needed_scopes.scopes
 
     @staticmethod
-    def setup(providers: Providers) -> "QueryState":
-        scopes = Scopes.setup(providers.all_scopes)
+    def setup(providers: Providers, fresh_scopes: Optional[Scopes] = None) -> "QueryState":
+        # Scopes are never mutated in place, so callers creating many states (e.g. one per
+        # filtered object) can build fresh_scopes once and share it between them
+        scopes = fresh_scopes if fresh_scopes is not None else Scopes.setup(providers.all_scopes)
         return QueryState(
             providers=providers,
             staged_object_lists={},
@@ -1,14 +1,29 @@
+import io
+from typing import Iterator, Optional, TextIO
+
 from sa.core.object_list import ObjectList
 from sa.core.sa_object import SAObject
 from sa.core.object_grouping import ObjectGrouping
 from sa.query_language.errors import assert_query
 
-def render_object_list(objects: ObjectList) -> str:
-    result = ""
-    for obj in objects.objects:
-        result += render_object_as_group(obj)
+def render_object_list(objects: ObjectList, out: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Render every grouping in the list. Groups are written to `out` one at a time when it is
+    given; otherwise the rendered text is returned.
+    """
+    if out is None:
+        buffer = io.StringIO()
+        render_object_list(objects, buffer)
+        return buffer.getvalue()
 
-    return result
+    for group_txt in render_object_list_iter(objects):
+        out.write(group_txt)
+    return None
+
+def render_object_list_iter(objects: ObjectList) -> Iterator[str]:
+    """Lazily render the list one grouping at a time, so callers can start printing early."""
+    for obj in objects.objects:
+        yield render_object_as_group(obj)
 
 def render_object_as_group(objects: ObjectGrouping) -> str:
     """
@@ -29,21 +44,22 @@ def render_object_as_group(objects: ObjectGrouping) -> str:
     RESET_COLOR = "\033[0m"
     header = f"{HEADER_COLOR}{objects.name}{RESET_COLOR}"
     
+    # Resolve each object's properties once; they're read for every field below
+    sourced_properties = [(obj.source, obj.properties) for obj in objects._objects]
+
     # Collect all unique property names
     all_properties = set()
-    for obj in objects._objects:
-        all_properties.update(obj.properties.keys())
-    all_properties = all_properties.intersection(objects.fields)
+    for _, properties in sourced_properties:
+        all_properties.update(properties.keys())
+    if objects._selected_fields is not None:
+        all_properties.intersection_update(objects._selected_fields)
     
-    properties_txt = ""
+    property_lines = []
     
     # Check each property to see if all providers agree
     for field in sorted(all_properties):
         # Get all values for this field from all objects
-        field_values = []
-        for obj in objects._objects:
-            if field in obj.properties:
-                field_values.append((obj.source, obj.properties[field]))
+        field_values = [(source, properties[field]) for source, properties in sourced_properties if field in properties]
         
         # Check if all values are the same
         first_value = field_values[0][1]
@@ -51,13 +67,13 @@ def render_object_as_group(objects: ObjectGrouping) -> str:
         
         if all_same:
             # All providers agree on the value
-            properties_txt += f"    {field}: {first_value}\n"
+            property_lines.append(f"    {field}: {first_value}\n")
         else:
             # Providers disagree, show each one with source
             for source, value in field_values:
-                properties_txt += f"    {field}@{source}: {value}\n"
+                property_lines.append(f"    {field}@{source}: {value}\n")
     
-    return f"{header}\n{properties_txt}"
+    return f"{header}\n{''.join(property_lines)}"
     
 
 def render_object_individually(obj: SAObject) -> str:
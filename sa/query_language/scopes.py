@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Optional, Union
 from sa.core.scope import Scope
 from typing import TYPE_CHECKING
 
@@ -11,6 +11,10 @@ if TYPE_CHECKING:
 @dataclass
 class Scopes:
     scopes: set[Scope]
+    # Scopes derived from this one, keyed by the operation that produced them. Scopes are never
+    # mutated in place, so e.g. the per-object states of a filter, which all start from the same
+    # fresh Scopes, only narrow it to each field once per query.
+    _derived: dict[tuple, Scopes] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         assert isinstance(self.scopes, set), f"Scopes must be a set, got {type(self.scopes).__name__}"
@@ -28,11 +32,17 @@ class Scopes:
 
     def set_id_types(self, id_types: set[tuple[str, str]]) -> Scopes:
         """Set the id types for all scopes."""
+        # Bucket by type once (only if some scope needs them) instead of rescanning every id type per scope
+        id_types_by_type: Optional[dict[str, set[tuple[str, str]]]] = None
         new_scopes = set()
         for scope in self.scopes:
             new_scope = scope.copy()
             if new_scope.needs_id_types:
-                new_scope.id_types = {(id_, type_) for id_, type_ in id_types if type_ == new_scope.type}
+                if id_types_by_type is None:
+                    id_types_by_type = {}
+                    for id_type in id_types:
+                        id_types_by_type.setdefault(id_type[1], set()).add(id_type)
+                new_scope.id_types = set(id_types_by_type.get(new_scope.type, ()))
             new_scopes.add(new_scope)
         return Scopes(new_scopes)
     
@@ -41,8 +51,12 @@ class Scopes:
         filtered_scopes = {scope for scope in self.scopes if scope.type == type}
         return Scopes(filtered_scopes)
     
-    def filter_fields(self, fields: list[str]) -> Scopes:
+    def filter_fields(self, fields: Union[list[str], set[str]]) -> Scopes:
         """For each scope, keep only the specified fields (intersection), then remove scopes with no fields left."""
+        key = ("filter_fields", frozenset(fields))
+        derived = self._derived.get(key)
+        if derived is not None:
+            return derived
         filtered_scopes = set()
         for scope in self.scopes:
             if scope.fields == "*":
@@ -55,7 +69,9 @@ class Scopes:
                     new_scope = scope.copy()
                     new_scope.fields = intersection
                     filtered_scopes.add(new_scope)
-        return Scopes(filtered_scopes)
+        derived = Scopes(filtered_scopes)
+        self._derived[key] = derived
+        return derived
     
     def add_condition(self, condition: tuple[str, str, str]) -> Scopes:
         """Add a condition to all scopes."""
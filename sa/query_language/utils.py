@@ -4,10 +4,15 @@ from sa.core.sa_object import SAObject
 from sa.core.object_list import ObjectList
 
 def flatten_fully(lst):
+    # Walk nested lists with an explicit stack of iterators instead of recursing
     result = []
-    for i in lst:
-        if isinstance(i, list):
-            result.extend(flatten_fully(i))
-        else:
+    stack = [iter(lst)]
+    while stack:
+        for i in stack[-1]:
+            if type(i) is list:
+                stack.append(iter(i))
+                break
             result.append(i)
+        else:
+            stack.pop()
     return result
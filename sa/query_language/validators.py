@@ -8,7 +8,13 @@ def is_single_object_list(qt: QueryType):
     return isinstance(qt, ObjectList) and len(qt.objects) == 1
 
 def either(*funcs: Callable[[QueryType], bool]):
-    return lambda qt: any(func(qt) for func in funcs)
+    # Plain loop rather than any(<genexpr>) so each check doesn't allocate a generator
+    def validator(qt: QueryType) -> bool:
+        for func in funcs:
+            if func(qt):
+                return True
+        return False
+    return validator
 
 def is_object_grouping(qt: QueryType):
     return isinstance(qt, ObjectGrouping)
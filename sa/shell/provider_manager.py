@@ -6,18 +6,45 @@ Handles loading and managing provider endpoint connections.
 
 from ast import Tuple
 import os
+import sys
 import json
+import time
+import threading
+import hashlib
 import requests
-from typing import List, Optional, Union
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Union
+from dataclasses import dataclass, field, replace
 
 from sa.query_language.debug import debugger
-from sa.core.object_grouping import ObjectGrouping, group_objects
 from sa.core.sa_object import SAObject
 from sa.core.object_list import ObjectList
 from sa.core.scope import Scope
 
 
+_SHAREABLE_TYPES = (str, int, float)
+
+# How long a provider's cached /all_data response is reused before fetching it again
+DATA_CACHE_TTL_SECONDS = 300
+
+
+def compact_object(obj_data: dict, shared_values: dict) -> dict:
+    """Rebuild a downloaded object with interned keys and shared scalar values.
+
+    Keys are interned so field lookups with the (interned) field names from parsed queries match
+    by identity. Top-level scalars repeat across objects (departments, levels, statuses...), so
+    every distinct value is stored once per response via shared_values, which also lets
+    equality checks between them short-circuit on identity.
+    """
+    compacted = {}
+    for key, value in obj_data.items():
+        if type(value) in _SHAREABLE_TYPES:
+            # Keyed on the type too, so 1 and 1.0 stay distinct
+            value = shared_values.setdefault((type(value), value), value)
+        compacted[sys.intern(key)] = value
+    return compacted
+
+
 @dataclass
 class ProviderConnection:
     """Represents a connection to a provider endpoint."""
@@ -25,12 +52,15 @@ class ProviderConnection:
     name: str = ""
     lazy_loading_scopes: List[Scope] = None
     server_type: str = ""  # "SAP" or "Registry"
+    # One keep-alive session per provider, so discovery, the initial fetch and every lazy
+    # scope download reuse the same TCP connection instead of reconnecting per request
+    session: requests.Session = field(default_factory=requests.Session, repr=False, compare=False)
     
     def determine_server_type(self) -> bool:
         """Determine if this is a SAP or Registry server using /wtf endpoint."""
         try:
             wtf_url = self.url.rstrip('/') + '/wtf'
-            response = requests.get(wtf_url, timeout=10)
+            response = self.session.get(wtf_url, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -65,7 +95,7 @@ class ProviderConnection:
                 hello_url = self.url.rstrip('/') + '/hello'
                 
                 # Make GET request to /hello endpoint
-                response = requests.get(hello_url, timeout=10)
+                response = self.session.get(hello_url, timeout=10)
                 response.raise_for_status()
                 
                 # Parse JSON response
@@ -113,36 +143,82 @@ class ProviderConnection:
             print(f"  ✗ Unexpected error connecting to {self.url}: {e}")
             return False
 
-    def fetch_initial_data(self) -> list[ObjectGrouping]:
+    @property
+    def data_cache_file(self) -> str:
+        """Path of the on-disk copy of this provider's /all_data response (~/.sa/cache)."""
+        url_hash = hashlib.sha1(self.url.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(os.path.expanduser("~"), ".sa", "cache", f"all_data-{url_hash}.json")
+
+    def read_cached_data(self) -> Optional[list]:
+        """Return the cached /all_data response if it is younger than DATA_CACHE_TTL_SECONDS."""
         try:
-            # Make GET request to /all_data endpoint
-            all_data_url = self.url.rstrip('/') + '/all_data'
-            response = requests.get(all_data_url, timeout=30)
-            response.raise_for_status()
-            
-            # Parse JSON response
-            data = response.json()
+            if time.time() - os.path.getmtime(self.data_cache_file) > DATA_CACHE_TTL_SECONDS:
+                return None
+            # The file holds the response body as it came over the wire; json.load detects its
+            # UTF-8/16/32 encoding from the bytes, independent of the locale
+            with open(self.data_cache_file, 'rb') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # ValueError covers both invalid JSON and bytes that don't decode
+            return None
+
+    def write_cached_data(self, response_body: bytes, log: Callable[[str], None] = print) -> None:
+        """Save a raw /all_data response body; failing to write the cache never fails the fetch."""
+        # Write to a temp file first so a concurrent reader never sees a partial file
+        temp_file = f"{self.data_cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.data_cache_file), exist_ok=True)
+            with open(temp_file, 'wb') as f:
+                f.write(response_body)
+            os.replace(temp_file, self.data_cache_file)
+        except OSError as e:
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+            log(f"    ⚠ Warning: Failed to cache data: {e}")
+
+    def fetch_initial_data(self, use_cache: bool = True, log: Callable[[str], None] = print) -> Optional[list[SAObject]]:
+        """Fetch this provider's /all_data as SAObjects, or None if it failed.
+
+        Status lines go to log, so a caller fetching from a worker thread can collect them and
+        print them itself.
+        """
+        try:
+            data = self.read_cached_data() if use_cache else None
+            if data is not None:
+                log("    ✓ Loaded cached data")
+            else:
+                # Make GET request to /all_data endpoint
+                all_data_url = self.url.rstrip('/') + '/all_data'
+                response = self.session.get(all_data_url, timeout=30)
+                response.raise_for_status()
+                
+                # Parse JSON response
+                data = response.json()
+                self.write_cached_data(response.content, log)
 
-            print("Downloaded data")
+                log("    ✓ Downloaded data")
             
             # Convert each object to SAObject
             sa_objects = []
+            shared_values = {}
             for obj_data in data:
                 try:
-                    sa_obj = SAObject(obj_data)
+                    sa_obj = SAObject(compact_object(obj_data, shared_values))
                     sa_objects.append(sa_obj)
                 except Exception as e:
-                    print(f"    ⚠ Warning: Failed to create SAObject: {e}")
+                    log(f"    ⚠ Warning: Failed to create SAObject: {e}")
                     continue
             
-            print(f"    ✓ Fetched {len(sa_objects)} objects")
+            log(f"    ✓ Fetched {len(sa_objects)} objects")
             return sa_objects
             
         except requests.exceptions.RequestException as e:
-            print(f"    ✗ Failed to fetch data: {e}")
+            log(f"    ✗ Failed to fetch data: {e}")
             return None
         except json.JSONDecodeError as e:
-            print(f"    ✗ Invalid JSON response: {e}")
+            log(f"    ✗ Invalid JSON response: {e}")
             return None
         except Exception as e:
             raise e
@@ -154,7 +230,7 @@ class ProviderConnection:
         
         try:
             saps_url = self.url.rstrip('/') + '/saps'
-            response = requests.get(saps_url, timeout=10)
+            response = self.session.get(saps_url, timeout=10)
             response.raise_for_status()
             
             # Parse the text response (ip:port format)
@@ -195,7 +271,7 @@ class ProviderConnection:
                 "id_types": list(scope.id_types)
             }
             
-            response = requests.post(lazy_load_url, json=request_data, timeout=30)
+            response = self.session.post(lazy_load_url, json=request_data, timeout=30)
             response.raise_for_status()
             
             # Parse JSON response
@@ -211,9 +287,10 @@ class ProviderConnection:
 
             # Convert each object to SAObject
             sa_objects = []
+            shared_values = {}
             for obj_data in sa_objects_data:
                 try:
-                    sa_obj = SAObject(obj_data)
+                    sa_obj = SAObject(compact_object(obj_data, shared_values))
                     sa_objects.append(sa_obj)
                 except Exception as e:
                     print(f"    ⚠ Warning: Failed to create SAObject: {e}")
@@ -235,21 +312,51 @@ class Providers:
     connections: List[ProviderConnection]
     all_data: ObjectList
     downloaded_scopes: set[Scope]
+    # Bumped whenever all_data is replaced, so a background fetch can tell it has been overtaken
+    data_version: int = 0
 
-    def fetch_initial_data(self) -> ObjectList:
+    def fetch_initial_data(self, use_cache: bool = True) -> None:
+        """Fetch every provider's /all_data, reusing responses cached on disk unless use_cache is False."""
         debugger.start_part("FETCH_INITIAL_DATA", "Fetch initial data")
+        self.replace_data(self.fetch_all_data(use_cache))
+        debugger.end_part("Fetch initial data")
+
+    def fetch_all_data(self, use_cache: bool = True, verbose: bool = True,
+                       connections: Optional[List[ProviderConnection]] = None) -> ObjectList:
+        """Fetch and group every provider's /all_data into a new ObjectList, leaving all_data as is.
+
+        Fetches through self.connections unless other connections (e.g. ones with their own
+        sessions) are passed.
+        """
+        if connections is None:
+            connections = self.connections
+        def fetch(connection: ProviderConnection) -> tuple[Optional[list[SAObject]], list[str]]:
+            # Workers collect their status lines instead of printing them, so lines from different
+            # providers can't interleave
+            messages = []
+            return connection.fetch_initial_data(use_cache, messages.append), messages
+
+        # Providers are independent HTTP endpoints, so fetch them concurrently;
+        # map() keeps the results in connection order
+        with ThreadPoolExecutor(max_workers=min(32, max(1, len(connections)))) as executor:
+            results = list(executor.map(fetch, connections))
         all_objects = []
+        for connection, (data, messages) in zip(connections, results):
+            if verbose:
+                print(f"  📥 Fetching from: {connection.name}")
+                for message in messages:
+                    print(message)
+            # A provider that failed to respond has reported why in its messages
+            if data is not None:
+                all_objects.extend(data)
         
-        for connection in self.connections:
-            print(f"  📥 Fetching from: {connection.name}")
-            data = connection.fetch_initial_data()
-            print("Fetched data")
-            all_objects.extend(data)
-        
-        grouped_objects = group_objects(all_objects)
-        self.all_data = ObjectList(grouped_objects)
-        self.all_data.validate_uniqueness()
-        debugger.end_part("Fetch initial data")
+        return ObjectList.from_sa_objects(all_objects)
+
+    def replace_data(self, all_data: ObjectList) -> None:
+        """Swap in freshly fetched data. Lazily downloaded scopes aren't part of it, so they're forgotten too."""
+        self.all_data = all_data
+        self.downloaded_scopes = set()
+        self.data_version += 1
 
     def download_scope(self, scope: Scope) -> bool:
         """Download data for the specified scope using lazy loading."""
@@ -269,11 +376,13 @@ class Providers:
         
         # remove objects that we already have
         # TODO: Should update objects in the future, not just remove them
-        objects_without_duplicates: list[SAObject] = [obj for obj in all_objects if obj.unique_ids - self.all_data.unique_ids != set()]
+        existing_unique_ids = self.all_data.unique_ids
+        # A subset test, rather than building each object's difference set only to compare it to set()
+        objects_without_duplicates: list[SAObject] = [obj for obj in all_objects if not obj.unique_ids <= existing_unique_ids]
 
         debugger.log("OBJECTS_WITHOUT_DUPLICATES", objects_without_duplicates)
 
-        self.all_data = ObjectList.combine(self.all_data, ObjectList(group_objects(objects_without_duplicates)))
+        self.all_data.merge(ObjectList.from_sa_objects(objects_without_duplicates))
         debugger.log("ALL_DATA", self.all_data)
 
         # Update downloaded_scopes to track what we've downloaded
@@ -302,6 +411,50 @@ class Providers:
         return {scope for connection in self.connections for scope in connection.lazy_loading_scopes}
 
 
+class BackgroundRefresher:
+    """Refetch provider data on a daemon thread every interval.
+
+    The fetched data is only staged; the shell swaps it in between queries with apply_pending,
+    so a query never sees all_data change underneath it. A requests.Session isn't thread-safe,
+    so the refresher fetches through copies of the connections with sessions of their own.
+    """
+
+    def __init__(self, providers: Providers, interval_seconds: float = DATA_CACHE_TTL_SECONDS):
+        self.providers = providers
+        self.interval_seconds = interval_seconds
+        self._connections = [replace(connection, session=requests.Session()) for connection in providers.connections]
+        self._lock = threading.Lock()
+        self._pending: Optional[tuple[int, ObjectList]] = None
+        self._thread = threading.Thread(target=self._run, name="sa-refresh", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval_seconds)
+            version = self.providers.data_version
+            try:
+                all_data = self.providers.fetch_all_data(use_cache=False, verbose=False, connections=self._connections)
+            except Exception:
+                # Keep serving the current data; the next round tries again
+                continue
+            with self._lock:
+                self._pending = (version, all_data)
+
+    def apply_pending(self) -> bool:
+        """Swap in data fetched in the background, unless all_data was replaced since that fetch started."""
+        with self._lock:
+            pending, self._pending = self._pending, None
+        if pending is None:
+            return False
+        version, all_data = pending
+        if version != self.providers.data_version:
+            return False
+        self.providers.replace_data(all_data)
+        return True
+
+
 def discover_sap_servers_recursively(initial_urls: List[str], visited: set = None) -> List[ProviderConnection]:
     """
     Recursively discover SAP servers from initial URLs, which may include registries.
@@ -5,18 +5,22 @@ Interactive shell for the SA Query Language.
 This shell continuously prompts for user input and processes queries.
 """
 
+import io
+import os
 import readline
+import shutil
+import subprocess
 import sys
 import argparse
 
 from sa.query_language.errors import QueryError
 from sa.query_language.scopes import Scopes
 from sa.query_language.query_state import QueryState
-from sa.query_language.parser import execute_query, execute_query_fully
+from sa.query_language.parser import execute_query, execute_query_fully, query_reads_data
 from sa.core.object_list import ObjectList
 from sa.core.object_grouping import ObjectGrouping
-from sa.query_language.render import render_object_as_group, render_object_list
-from sa.shell.provider_manager import Providers, load_providers
+from sa.query_language.render import render_object_as_group, render_object_list, render_object_list_iter
+from sa.shell.provider_manager import BackgroundRefresher, Providers, load_providers
 from sa.query_language.chain import Chain
 from sa.query_language.debug import debugger
 import traceback
@@ -48,12 +52,18 @@ def print_section_footer():
 
 
 def execute_query_shell(query: str, providers: Providers):
-    """Execute a query string and return the result."""
+    """Execute a query string and return the result, or the exception it raised."""
     try:
         result = execute_query_fully(query, providers)
         return result, None
     except Exception as e:
-        return None, traceback.format_exc()
+        # Formatted by format_error only if it's actually shown
+        return None, e
+
+
+def format_error(error: Exception) -> str:
+    """Format an exception returned by execute_query_shell with its traceback."""
+    return "".join(traceback.format_exception(type(error), error, error.__traceback__))
 
 
 def format_result(result, show_count: bool = True):
@@ -63,9 +73,11 @@ def format_result(result, show_count: bool = True):
         if len(result.objects) == 0:
             return "No objects found"
         else:
-            output = f"Found {len(result.objects)} object(s):\n" if show_count else ""
-            output += render_object_list(result)
-            return output
+            output = io.StringIO()
+            if show_count:
+                output.write(f"Found {len(result.objects)} object(s):\n")
+            render_object_list(result, output)
+            return output.getvalue()
     elif isinstance(result, ObjectGrouping):
         return render_object_as_group(result)
     elif isinstance(result, bool):
@@ -76,23 +88,57 @@ def format_result(result, show_count: bool = True):
         return str(result)
 
 
-def run_non_interactive(query: str, raise_errors: bool = False, debug_file: str = None):
-    """Run a single query in non-interactive mode."""
+def print_result(result):
+    """
+    Print a query result in the interactive shell. Object lists are streamed one grouping at a
+    time, and paged through `less` when they would not fit on the terminal.
+    """
+    if not isinstance(result, ObjectList) or len(result.objects) == 0:
+        print(format_result(result, show_count=False))
+        return
+
+    groups = render_object_list_iter(result)
+    if sys.stdout.isatty() and len(result.objects) > shutil.get_terminal_size().lines:
+        try:
+            pager = subprocess.Popen(['less', '-FRSX'], stdin=subprocess.PIPE, text=True)
+        except OSError:
+            pager = None
+        if pager is not None:
+            try:
+                for group_txt in groups:
+                    pager.stdin.write(group_txt)
+                pager.stdin.close()
+            except BrokenPipeError:
+                # The user quit the pager before the whole list was rendered
+                pass
+            pager.wait()
+            return
+
+    for group_txt in groups:
+        sys.stdout.write(group_txt)
+    print()
+
+
+def run_non_interactive(queries: list[str], raise_errors: bool = False, debug_file: str = None, use_cache: bool = True):
+    """Run one or more queries in non-interactive mode, loading the providers' data once for all of them."""
     providers = load_providers()
-    providers.fetch_initial_data()
+    # Only fetch when some query can read data; the queries are parsed once here and cached for the run
+    if any(query_reads_data(query) for query in queries):
+        providers.fetch_initial_data(use_cache)
 
-    print("-" * 100)
-    
-    result, error = execute_query_shell(query, providers)
+    for query in queries:
+        print("-" * 100)
+        
+        result, error = execute_query_shell(query, providers)
 
-    if isinstance(result, QueryError):
-        if raise_errors:
-            raise result
+        if isinstance(result, QueryError):
+            if raise_errors:
+                raise result
 
-    if error:
-        print(f"Error: {error}")
-    else:
-        print(format_result(result))
+        if error:
+            print(f"Error: {format_error(error)}")
+        else:
+            print(format_result(result))
     
     if debug_file:
         print(f"🐛 Saving debug output to: {debug_file}")
@@ -104,8 +150,6 @@ def run_non_interactive(query: str, raise_errors: bool = False, debug_file: str
 
 def add_sap_to_file(sap_endpoint: str):
     """Add a SAP server endpoint to saps.txt file."""
-    import os
-    
     # Get the default saps.txt path
     home_dir = os.path.expanduser("~")
     sa_dir = os.path.join(home_dir, ".sa")
@@ -165,17 +209,20 @@ def main():
 Examples:
   %(prog)s                                    # Start interactive shell
   %(prog)s ".equals(.get_field('name'), 'John')"  # Run single query
+  %(prog)s "employee.count()" "product.count()"  # Run several queries, loading data once
   %(prog)s --print-profiling-information ".equals(.get_field('name'), 'John')"  # Run query with profiling output
   %(prog)s --debug result.html ".equals(.get_field('name'), 'John')"  # Run query with debug output to HTML file
   %(prog)s --raise ".equals(.get_field(\\'name\\'), \\'John\\')"  # Run query and raise QueryError exceptions
+  %(prog)s --no-cache ".equals(.get_field('name'), 'John')"  # Run query on freshly fetched data
+  %(prog)s --no-refresh                      # Start interactive shell without background refreshes
   %(prog)s --add-sap localhost:8080          # Add SAP server to saps.txt and exit
   %(prog)s --update                          # Update SA to latest version from GitHub
         """
     )
     parser.add_argument(
         'query', 
-        nargs='?', 
-        help='Query to execute (if not provided, starts interactive shell)'
+        nargs='*', 
+        help='Queries to execute against a single data load (if not provided, starts interactive shell)'
     )
     parser.add_argument(
         '--print-profiling-information',
@@ -198,6 +245,18 @@ Examples:
         metavar='FILE',
         help='Save debug output to HTML file (e.g., --debug result.html)'
     )
+    parser.add_argument(
+        '--no-cache',
+        dest='use_cache',
+        action='store_false',
+        help='Fetch fresh data from every provider instead of reusing data cached in ~/.sa/cache'
+    )
+    parser.add_argument(
+        '--no-refresh',
+        dest='background_refresh',
+        action='store_false',
+        help='Don\'t refetch provider data in the background while the interactive shell is open'
+    )
     parser.add_argument(
         '--add-sap',
         metavar='IP:PORT',
@@ -212,9 +271,6 @@ Examples:
     
     # Handle update command
     if args.update:
-        import subprocess
-        import sys
-        
         print("🔄 Updating SA to the latest version from GitHub...")
         print("📦 Running: pip install --upgrade git+https://github.com/sebitommy123/SA.git")
         
@@ -246,16 +302,53 @@ Examples:
         add_sap_to_file(args.add_sap)
         return
     
-    # If a query is provided, run in non-interactive mode
+    # If queries are provided, run them in non-interactive mode
     if args.query:
-        run_non_interactive(args.query, args.raise_errors, args.debug)
+        run_non_interactive(args.query, args.raise_errors, args.debug, args.use_cache)
         return
     
     # Otherwise, start interactive shell
-    run_interactive_shell(args.debug)
+    run_interactive_shell(args.debug, args.use_cache, args.background_refresh)
+
 
+def print_help(providers: Providers):
+    """Print the interactive shell help message."""
+    print("\n📖 Available Commands:")
+    print("  help     - Show this help message")
+    print("  refresh  - Reload data from all providers")
+    print("  quit     - Exit the shell")
+    print("  exit     - Exit the shell")
+    print("  q        - Exit the shell")
+    print()
+    print("📝 Query Examples:")
+    print("  .get_field('name')                    - Get all name values")
+    print("  .equals(.get_field('name'), 'John')   - Find objects with name='John'")
+    print("  .filter(.equals(.get_field('department'), 'Engineering'))")
+    print("                                        - Filter by department")
+    print()
+
+
+def refresh_providers(providers: Providers):
+    """Reload data from all providers."""
+    print("\n🔄 Refreshing data from all providers...")
+    print_section_header("Refreshing Data")
+    # Always go to the providers, which also rewrites the on-disk cache
+    providers.fetch_initial_data(use_cache=False)
+    print(f"\n📊 Summary: {len(providers.all_data.objects)} total objects loaded")
+    print_section_footer()
+    print("✅ Data refreshed successfully!")
+    print()
 
-def run_interactive_shell(debug_file: str = None):
+
+# Built-in shell commands, matched case-insensitively against the whole input line
+EXIT_COMMANDS = frozenset({'quit', 'exit', 'q'})
+SHELL_COMMANDS = {
+    'help': print_help,
+    'refresh': refresh_providers,
+}
+
+
+def run_interactive_shell(debug_file: str = None, use_cache: bool = True, background_refresh: bool = True):
     """Run the interactive shell loop."""
     print_header()
     
@@ -267,9 +360,16 @@ def run_interactive_shell(debug_file: str = None):
 
     # Fetch data from all providers that support ALL_AT_ONCE mode
     print_section_header("Fetching Data")
-    providers.fetch_initial_data()
+    providers.fetch_initial_data(use_cache)
     print(f"\n📊 Summary: {len(providers.all_data._objects)} total objects loaded")
     print_section_footer()
+
+    # Keep the data fresh without blocking the prompt. The debugger isn't thread-safe,
+    # so debug sessions only refresh on demand, as do sessions started with --no-refresh
+    refresher = None
+    if background_refresh and not debug_file:
+        refresher = BackgroundRefresher(providers)
+        refresher.start()
     
     # Main shell loop
     print("🚀 Ready for queries! Type your commands below:")
@@ -281,51 +381,31 @@ def run_interactive_shell(debug_file: str = None):
             # Get user input
             user_input = input("sa> ").strip()
             
-            # Check for exit commands
-            if user_input.lower() in ['quit', 'exit', 'q']:
+            # Dispatch built-in shell commands
+            command = user_input.lower()
+            if command in EXIT_COMMANDS:
                 print("\n👋 Goodbye!")
                 break
             
-            # Check for help command
-            if user_input.lower() == 'help':
-                print("\n📖 Available Commands:")
-                print("  help     - Show this help message")
-                print("  refresh  - Reload data from all providers")
-                print("  quit     - Exit the shell")
-                print("  exit     - Exit the shell")
-                print("  q        - Exit the shell")
-                print()
-                print("📝 Query Examples:")
-                print("  .get_field('name')                    - Get all name values")
-                print("  .equals(.get_field('name'), 'John')   - Find objects with name='John'")
-                print("  .filter(.equals(.get_field('department'), 'Engineering'))")
-                print("                                        - Filter by department")
-                print()
+            handler = SHELL_COMMANDS.get(command)
+            if handler is not None:
+                handler(providers)
                 continue
             
-            # Check for refresh command
-            if user_input.lower() == 'refresh':
-                print("\n🔄 Refreshing data from all providers...")
-                print_section_header("Refreshing Data")
-                providers.fetch_initial_data()
-                print(f"\n📊 Summary: {len(providers.all_data.objects)} total objects loaded")
-                print_section_footer()
-                print("✅ Data refreshed successfully!")
-                print()
-                continue
-            
-            
             # Skip empty input
             if not user_input:
                 continue
             
+            if refresher is not None and refresher.apply_pending():
+                print(f"🔄 Data refreshed in the background ({len(providers.all_data.objects)} objects)")
+            
             # Execute the query
             result, error = execute_query_shell(user_input, providers)
             
             if error:
-                print(f"❌ Error: {error}")
+                print(f"❌ Error: {format_error(error)}")
             else:
-                print(format_result(result, show_count=False))
+                print_result(result)
             
             if debug_file:
                 print(f"🐛 Saving debug output to: {debug_file}")
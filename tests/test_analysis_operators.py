@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the describe and summary operators on lists of grouped objects.
+"""
+
+import pytest
+from sa.core.sa_object import SAObject
+from sa.core.object_list import ObjectList
+from sa.shell.provider_manager import Providers
+from sa.query_language.parser import execute_query_fully
+
+
+def create_providers() -> Providers:
+    """Create providers holding one object defined by two sources and one defined by a single source."""
+    objects = [
+        SAObject({
+            "__types__": ["person", "employee"],
+            "__id__": "alice",
+            "__source__": "hr",
+            "name": "Alice"
+        }),
+        SAObject({
+            "__types__": ["person"],
+            "__id__": "alice",
+            "__source__": "crm",
+            "email": "alice@example.com"
+        }),
+        SAObject({
+            "__types__": ["person"],
+            "__id__": "bob",
+            "__source__": "crm",
+            "email": "bob@example.com"
+        }),
+    ]
+    return Providers(connections=[], all_data=ObjectList.from_sa_objects(objects), downloaded_scopes=set())
+
+
+@pytest.mark.parametrize("operator", ["describe", "summary"])
+def test_describes_grouped_objects(operator):
+    """Test that both operators report the types, sources and properties of every source's object."""
+    result = execute_query_fully(f".{operator}()", create_providers())
+
+    assert result.splitlines()[:3] == [
+        "ObjectList with 2 objects",
+        "Types: employee, person",
+        "Sources: crm, hr",
+    ]
+    assert "  employee (1 objects) from sources: hr\n    Properties: name" in result
+    assert "  person (2 objects) from sources: crm, hr\n    Properties: email, name" in result
+
+
+@pytest.mark.parametrize("operator", ["describe", "summary"])
+def test_describes_empty_list(operator):
+    """Test that both operators handle a filter that matches nothing."""
+    result = execute_query_fully(f"person[.email == 'nobody'].{operator}()", create_providers())
+
+    assert result == "Empty ObjectList"
+
+
+@pytest.mark.parametrize("operator", ["describe", "summary"])
+def test_describes_primitive(operator):
+    """Test that both operators fall back to str() for values that aren't object lists."""
+    result = execute_query_fully(f"employee.name.{operator}()", create_providers())
+
+    assert result == "Alice"
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests that [.field == literal] filters answered from ObjectList.field_value_index
+match evaluating the filter on every grouping.
+"""
+
+import pytest
+from sa.core.sa_object import SAObject
+from sa.core.object_list import ObjectList
+from sa.shell.provider_manager import Providers
+from sa.query_language.errors import QueryError
+from sa.query_language.parser import execute_query_fully
+
+
+def create_objects(extra: list[dict]) -> list[SAObject]:
+    """Create three single-source employees plus the given extra objects."""
+    data = [
+        {"__types__": ["employee"], "__id__": "emp_1", "__source__": "hr", "department": "Sales", "level": 3},
+        {"__types__": ["employee"], "__id__": "emp_2", "__source__": "hr", "department": "Engineering", "level": 2},
+        {"__types__": ["employee"], "__id__": "emp_3", "__source__": "hr", "department": "Sales", "level": 3.0},
+    ]
+    return [SAObject(obj) for obj in data + extra]
+
+
+def run_query(query: str, objects: list[SAObject]):
+    """Run a query on fresh providers, returning the matched ids or the error message."""
+    providers = Providers(connections=[], all_data=ObjectList.from_sa_objects(objects), downloaded_scopes=set())
+    result = execute_query_fully(query, providers)
+    if isinstance(result, QueryError):
+        return ("error", str(result))
+    return [grouping.id for grouping in result.objects]
+
+
+def assert_same_as_scan(query: str, objects: list[SAObject], monkeypatch):
+    """Run a query with and without the field value index, check both agree and return the result."""
+    indexed = run_query(query, objects)
+    with monkeypatch.context() as patch:
+        # No index for any field, so filter evaluates the chain on every grouping
+        patch.setattr(ObjectList, "field_value_index", lambda self, field_name: None)
+        scanned = run_query(query, objects)
+    assert indexed == scanned
+    return indexed
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("employee[.department == 'Sales']", ["emp_1", "emp_3"]),
+    ("employee['Sales' == .department]", ["emp_1", "emp_3"]),
+    ("employee[.department == 'Marketing']", []),
+    ("employee[.level == 3]", ["emp_1", "emp_3"]),
+])
+def test_scalar_fields(query, expected, monkeypatch):
+    """Test that lookups on plain scalar fields match the scan, including 3 == 3.0."""
+    assert assert_same_as_scan(query, create_objects([]), monkeypatch) == expected
+
+
+@pytest.mark.parametrize("query", [
+    "employee[.department == 'Sales']",
+    "employee[.department! == 'Sales']",
+])
+def test_missing_field(query, monkeypatch):
+    """Test groupings without the field: skipped by .field, an error with .field!."""
+    objects = create_objects([
+        {"__types__": ["employee"], "__id__": "emp_4", "__source__": "hr", "level": 1},
+    ])
+    result = assert_same_as_scan(query, objects, monkeypatch)
+    if "!" in query:
+        assert result[0] == "error"
+    else:
+        assert result == ["emp_1", "emp_3"]
+
+
+def test_list_valued_field(monkeypatch):
+    """Test that a list value makes the index fall back to the scan."""
+    objects = create_objects([
+        {"__types__": ["employee"], "__id__": "emp_4", "__source__": "hr", "department": ["Sales", "Legal"]},
+    ])
+    assert ObjectList.from_sa_objects(objects).field_value_index("department") is None
+    assert assert_same_as_scan("employee[.department == 'Sales']", objects, monkeypatch) == ["emp_1", "emp_3"]
+
+
+def test_multi_source_grouping_that_agrees(monkeypatch):
+    """Test that a grouping whose sources agree on the value is found by the lookup."""
+    objects = create_objects([
+        {"__types__": ["employee"], "__id__": "emp_4", "__source__": "hr", "department": "Sales"},
+        {"__types__": ["person"], "__id__": "emp_4", "__source__": "crm", "department": "Sales"},
+    ])
+    assert ObjectList.from_sa_objects(objects).field_value_index("department") is not None
+    assert assert_same_as_scan("employee[.department == 'Sales']", objects, monkeypatch) == ["emp_1", "emp_3", "emp_4"]
+
+
+def test_multi_source_grouping_that_disagrees(monkeypatch):
+    """Test that conflicting definitions raise the scan's error rather than matching either value."""
+    objects = create_objects([
+        {"__types__": ["employee"], "__id__": "emp_4", "__source__": "hr", "department": "Sales"},
+        {"__types__": ["person"], "__id__": "emp_4", "__source__": "crm", "department": "Legal"},
+    ])
+    assert ObjectList.from_sa_objects(objects).field_value_index("department") is None
+    result = assert_same_as_scan("employee[.department == 'Sales']", objects, monkeypatch)
+    assert result[0] == "error"
+    assert "conflicting definitions" in result[1]
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests that a filter fused with the select after it (filter_select) gives the same
+results as running the two operators one after the other.
+"""
+
+import pytest
+from sa.core.sa_object import SAObject
+from sa.core.object_list import ObjectList
+from sa.shell.provider_manager import Providers
+from sa.query_language.errors import QueryError
+from sa.query_language.parser import execute_query_fully, parse_and_compile_query
+from sa.query_language.operators.list_operations import FilterOperator
+
+
+def create_providers() -> Providers:
+    """Create providers with three employees, one of them also defined by a second source."""
+    objects = [
+        SAObject({"__types__": ["employee"], "__id__": "emp_1", "__source__": "hr", "name": "Alice", "department": "Sales", "level": "VP"}),
+        SAObject({"__types__": ["employee"], "__id__": "emp_2", "__source__": "hr", "name": "Bob", "department": "Engineering", "level": "Junior"}),
+        SAObject({"__types__": ["employee"], "__id__": "emp_3", "__source__": "hr", "name": "Carol", "department": "Sales", "level": "Senior"}),
+        SAObject({"__types__": ["person"], "__id__": "emp_3", "__source__": "crm", "email": "carol@example.com"}),
+    ]
+    return Providers(connections=[], all_data=ObjectList.from_sa_objects(objects), downloaded_scopes=set())
+
+
+def run_query(query: str, providers: Providers):
+    """Run a query, returning each resulting grouping's id and visible fields, or the error message."""
+    result = execute_query_fully(query, providers)
+    if isinstance(result, QueryError):
+        return ("error", str(result))
+    return [(grouping.id, grouping.fields) for grouping in result.objects]
+
+
+def run_unfused(query: str, monkeypatch):
+    """Run a query with filter fusion turned off."""
+    with monkeypatch.context() as patch:
+        patch.setattr(FilterOperator, "fuse_next", None)
+        # Compiled queries are cached by query string, so compile this one afresh (and again after)
+        parse_and_compile_query.cache_clear()
+        try:
+            return run_query(query, create_providers())
+        finally:
+            parse_and_compile_query.cache_clear()
+
+
+@pytest.mark.parametrize("query, expected", [
+    # Answered from the field value index
+    ("employee[.department == 'Sales'].select('name')", [("emp_1", {"name"}), ("emp_3", {"name"})]),
+    # Evaluated on every grouping
+    ("employee[.level =~ 'V'].select('name', 'level')", [("emp_1", {"name", "level"})]),
+    ("employee[.department == 'Sales'].select('email')", [("emp_1", set()), ("emp_3", {"email"})]),
+    ("employee[.department == 'Marketing'].select('name')", []),
+])
+def test_fused_matches_unfused(query, expected, monkeypatch):
+    """Test that the fused node picks the same groupings and narrows them to the same fields."""
+    assert "filter_select" in str(parse_and_compile_query(query))
+    fused = run_query(query, create_providers())
+    assert fused == run_unfused(query, monkeypatch)
+    assert fused == expected
+
+
+def test_fused_select_leaves_source_list_untouched():
+    """Test that narrowing the survivors doesn't narrow the groupings in all_data, even when every grouping survives."""
+    providers = create_providers()
+    assert run_query("employee[.name =~ '.'].select('name')", providers) == [
+        ("emp_1", {"name"}), ("emp_2", {"name"}), ("emp_3", {"name"}),
+    ]
+    assert [grouping.fields for grouping in providers.all_data.objects] == [
+        {"name", "department", "level"},
+        {"name", "department", "level"},
+        {"name", "department", "level", "email"},
+    ]
+
+
+def test_select_over_chains_is_not_fused():
+    """Test that a select whose arguments are field chains keeps running as its own node."""
+    query = "employee[.department == 'Sales'][[.name]]"
+    assert "filter_select" not in str(parse_and_compile_query(query))
@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 """
-Tests to verify that the group_by_id_types method works correctly
+Tests to verify that ObjectList.from_sa_objects groups objects correctly
 with various grouping scenarios.
 """
 
 import pytest
 from sa.core.sa_object import SAObject
-from sa.query_language.object_list import ObjectList
+from sa.core.object_list import ObjectList
 
 
 class TestGroupingCorrectness:
@@ -36,21 +36,21 @@ class TestGroupingCorrectness:
             "name": "Object A3"
         })
         
-        obj_list = ObjectList([obj1, obj2, obj3])
-        grouped_lists = obj_list.group_by_id_types()
+        obj_list = ObjectList.from_sa_objects([obj1, obj2, obj3])
+        grouped_lists = obj_list.objects
         
         # Should have exactly one group containing all three objects
         assert len(grouped_lists) == 1, f"Expected 1 group, got {len(grouped_lists)}"
         
         group = grouped_lists[0]
-        assert len(group.objects) == 3, f"Expected 3 objects in group, got {len(group.objects)}"
+        assert len(group._objects) == 3, f"Expected 3 objects in group, got {len(group._objects)}"
         
         # Verify all objects are present
-        group_ids = {obj.id for obj in group.objects}
+        group_ids = {obj.id for obj in group._objects}
         assert group_ids == {"obj_A"}, f"Expected all objects to have id 'obj_A', got {group_ids}"
         
         # Verify all sources are present
-        group_sources = {obj.source for obj in group.objects}
+        group_sources = {obj.source for obj in group._objects}
         assert group_sources == {"source_A", "source_B", "source_C"}, f"Expected all sources, got {group_sources}"
         
         print("✓ Objects with same ID but different types grouped correctly")
@@ -78,20 +78,20 @@ class TestGroupingCorrectness:
             "name": "Object C"
         })
         
-        obj_list = ObjectList([obj1, obj2, obj3])
-        grouped_lists = obj_list.group_by_id_types()
+        obj_list = ObjectList.from_sa_objects([obj1, obj2, obj3])
+        grouped_lists = obj_list.objects
         
         # Should have 3 separate groups since IDs are different
         assert len(grouped_lists) == 3, f"Expected 3 groups, got {len(grouped_lists)}"
         
         # Each group should have exactly one object
         for group in grouped_lists:
-            assert len(group.objects) == 1, f"Expected 1 object per group, got {len(group.objects)}"
+            assert len(group._objects) == 1, f"Expected 1 object per group, got {len(group._objects)}"
         
         # Verify all objects are present
         all_grouped_objects = []
         for group in grouped_lists:
-            all_grouped_objects.extend(group.objects)
+            all_grouped_objects.extend(group._objects)
         
         grouped_ids = {obj.id for obj in all_grouped_objects}
         assert grouped_ids == {"obj_A", "obj_B", "obj_C"}, f"Expected all IDs, got {grouped_ids}"
@@ -137,20 +137,20 @@ class TestGroupingCorrectness:
             "name": "Object 5"
         })
         
-        obj_list = ObjectList([obj1, obj2, obj3, obj4, obj5])
-        grouped_lists = obj_list.group_by_id_types()
+        obj_list = ObjectList.from_sa_objects([obj1, obj2, obj3, obj4, obj5])
+        grouped_lists = obj_list.objects
         
         # Should have 5 separate groups since all IDs are different
         assert len(grouped_lists) == 5, f"Expected 5 groups, got {len(grouped_lists)}"
         
         # Each group should have exactly one object
         for group in grouped_lists:
-            assert len(group.objects) == 1, f"Expected 1 object per group, got {len(group.objects)}"
+            assert len(group._objects) == 1, f"Expected 1 object per group, got {len(group._objects)}"
         
         # Verify all objects are present
         all_grouped_objects = []
         for group in grouped_lists:
-            all_grouped_objects.extend(group.objects)
+            all_grouped_objects.extend(group._objects)
         
         grouped_ids = {obj.id for obj in all_grouped_objects}
         assert grouped_ids == {"obj_1", "obj_2", "obj_3", "obj_4", "obj_5"}, f"Expected all IDs, got {grouped_ids}"
@@ -159,8 +159,8 @@ class TestGroupingCorrectness:
     
     def test_empty_object_list(self):
         """Test that empty object list returns empty result."""
-        obj_list = ObjectList([])
-        grouped_lists = obj_list.group_by_id_types()
+        obj_list = ObjectList.from_sa_objects([])
+        grouped_lists = obj_list.objects
         
         assert len(grouped_lists) == 0, f"Expected 0 groups for empty list, got {len(grouped_lists)}"
         print("✓ Empty object list handled correctly")
@@ -174,12 +174,12 @@ class TestGroupingCorrectness:
             "name": "Single Object"
         })
         
-        obj_list = ObjectList([obj])
-        grouped_lists = obj_list.group_by_id_types()
+        obj_list = ObjectList.from_sa_objects([obj])
+        grouped_lists = obj_list.objects
         
         assert len(grouped_lists) == 1, f"Expected 1 group for single object, got {len(grouped_lists)}"
-        assert len(grouped_lists[0].objects) == 1, f"Expected 1 object in group, got {len(grouped_lists[0].objects)}"
-        assert grouped_lists[0].objects[0].id == "obj_A", "Expected correct object in group"
+        assert len(grouped_lists[0]._objects) == 1, f"Expected 1 object in group, got {len(grouped_lists[0]._objects)}"
+        assert grouped_lists[0]._objects[0].id == "obj_A", "Expected correct object in group"
         
         print("✓ Single object handled correctly")
     
@@ -248,8 +248,8 @@ class TestGroupingCorrectness:
             })
         ]
         
-        obj_list = ObjectList(objects)
-        grouped_lists = obj_list.group_by_id_types()
+        obj_list = ObjectList.from_sa_objects(objects)
+        grouped_lists = obj_list.objects
         
         # Should have 4 groups
         assert len(grouped_lists) == 4, f"Expected 4 groups, got {len(grouped_lists)}"
@@ -257,14 +257,14 @@ class TestGroupingCorrectness:
         # Verify all objects are present
         all_grouped_objects = []
         for group in grouped_lists:
-            all_grouped_objects.extend(group.objects)
+            all_grouped_objects.extend(group._objects)
         
         assert len(all_grouped_objects) == 8, f"Expected 8 total objects, got {len(all_grouped_objects)}"
         
         # Verify grouping by ID
         group_by_id = {}
         for group in grouped_lists:
-            for obj in group.objects:
+            for obj in group._objects:
                 if obj.id not in group_by_id:
                     group_by_id[obj.id] = []
                 group_by_id[obj.id].append(obj)
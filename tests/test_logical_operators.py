@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for the and, or and any operators.
+"""
+
+import pytest
+from sa.core.sa_object import SAObject
+from sa.core.object_list import ObjectList
+from sa.shell.provider_manager import Providers
+from sa.query_language.parser import execute_query_fully
+
+
+def create_providers() -> Providers:
+    """Create providers holding three employees."""
+    objects = [
+        SAObject({
+            "__types__": ["employee"],
+            "__id__": f"emp_{i}",
+            "__source__": "hr",
+            "department": department,
+            "level": level
+        })
+        for i, (department, level) in enumerate([("Sales", "VP"), ("Sales", "Junior"), ("Engineering", "VP")])
+    ]
+    return Providers(connections=[], all_data=ObjectList.from_sa_objects(objects), downloaded_scopes=set())
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("employee[.and(.department == 'Sales', .level == 'VP')].count()", 1),
+    ("employee[.or(.department == 'Sales', .level == 'VP')].count()", 3),
+    ("employee[.or(.department == 'Marketing', .level == 'Junior')].count()", 1),
+    ("employee.any()", True),
+    ("employee[.department == 'Marketing'].any()", False),
+])
+def test_logical_operators(query, expected):
+    """Test that the operators run on any context and combine their arguments."""
+    assert execute_query_fully(query, create_providers()) == expected
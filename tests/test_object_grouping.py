@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for ObjectGrouping field reads, equality and hashing.
+"""
+
+import pytest
+from sa.core.sa_object import SAObject
+from sa.core.object_list import ObjectList
+from sa.core.object_grouping import ObjectGrouping
+from sa.shell.provider_manager import Providers
+from sa.query_language.errors import QueryError
+from sa.query_language.query_state import QueryState
+
+
+def create_object(obj_id: str, source: str, **fields) -> SAObject:
+    return SAObject({"__types__": ["employee"], "__id__": obj_id, "__source__": source, **fields})
+
+
+def create_query_state() -> QueryState:
+    return QueryState.setup(Providers(connections=[], all_data=ObjectList([]), downloaded_scopes=set()))
+
+
+def test_scalar_field_is_memoized():
+    """Test that a scalar field is reconciled once and then read from the memo."""
+    grouping = ObjectGrouping([create_object("a", "hr", name="Alice"), create_object("a", "crm", name="Alice")], {}, None)
+    query_state = create_query_state()
+
+    assert grouping.get_field("name", query_state) == "Alice"
+    assert grouping._field_values == {"name": "Alice"}
+    # Served from the memo, without looking at the objects again
+    grouping._field_values["name"] = "memoized"
+    assert grouping.get_field("name", query_state) == "memoized"
+
+
+def test_list_field_is_not_memoized():
+    """Test that list values are resolved afresh on every read, so changing one doesn't leak into the next."""
+    grouping = ObjectGrouping([create_object("a", "hr", skills=["Python", "SQL"])], {}, None)
+    query_state = create_query_state()
+
+    skills = grouping.get_field("skills", query_state)
+    skills.append("Go")
+
+    assert grouping.get_field("skills", query_state) == ["Python", "SQL"]
+    assert grouping._field_values is None
+
+
+def test_override_wins_over_memo():
+    """Test that a field override is returned even after the stored value was memoized."""
+    grouping = ObjectGrouping([create_object("a", "hr", name="Alice")], {}, None)
+    query_state = create_query_state()
+
+    assert grouping.get_field("name", query_state) == "Alice"
+    grouping._field_overrides["name"] = "Overridden"
+    assert grouping.get_field("name", query_state) == "Overridden"
+    grouping.reset()
+    assert grouping.get_field("name", query_state) == "Alice"
+
+
+def test_failed_reads_are_not_memoized():
+    """Test that missing and conflicting fields raise on every read instead of caching a value."""
+    grouping = ObjectGrouping([create_object("a", "hr", name="Alice"), create_object("a", "crm", name="Alicia")], {}, None)
+    query_state = create_query_state()
+
+    for _ in range(2):
+        with pytest.raises(QueryError, match="conflicting definitions"):
+            grouping.get_field("name", query_state)
+        with pytest.raises(QueryError, match="has no field"):
+            grouping.get_field("salary", query_state)
+    assert grouping._field_values is None
+
+
+def test_equal_groupings_hash_alike():
+    """Test that groupings over equal objects compare equal, hash alike and dedupe in sets."""
+    first = ObjectGrouping([create_object("a", "hr", name="Alice")], {}, None)
+    second = ObjectGrouping([create_object("a", "hr", name="Alice")], {}, None)
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert len({first, second}) == 1
+    assert {first: "value"}[second] == "value"
+
+
+def test_unequal_groupings():
+    """Test that groupings differing in id, objects, selected fields or overrides compare unequal."""
+    grouping = ObjectGrouping([create_object("a", "hr", name="Alice")], {}, None)
+
+    assert grouping != ObjectGrouping([create_object("b", "hr", name="Alice")], {}, None)
+    assert grouping != ObjectGrouping([create_object("a", "hr", name="Alicia")], {}, None)
+    assert grouping != ObjectGrouping([create_object("a", "crm", name="Alice")], {}, None)
+    assert grouping != grouping.select_fields({"name"})
+    assert grouping != ObjectGrouping([create_object("a", "hr", name="Alice")], {"name": "Overridden"}, None)
+    # Same id, so same hash, but still distinct set members
+    assert len({grouping, grouping.select_fields({"name"})}) == 2
+
+
+def test_compare_with_other_types():
+    """Test that comparing with a non-grouping is unequal rather than an error."""
+    grouping = ObjectGrouping([create_object("a", "hr")], {}, None)
+
+    assert grouping != "a"
+    assert grouping != None
+    assert grouping.__eq__("a") is NotImplemented
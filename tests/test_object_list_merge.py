@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for ObjectList.merge, which folds downloaded objects into a list in place.
+"""
+
+import pytest
+from sa.core.sa_object import SAObject
+from sa.core.object_list import ObjectList
+from sa.shell.provider_manager import Providers
+from sa.query_language.parser import execute_query_fully
+
+
+def create_object(obj_id: str, source: str, types: list[str], **fields) -> SAObject:
+    return SAObject({"__types__": types, "__id__": obj_id, "__source__": source, **fields})
+
+
+def test_merge_new_ids_appended():
+    """Test that groupings for new ids are appended in order."""
+    object_list = ObjectList.from_sa_objects([create_object("a", "hr", ["employee"])])
+    object_list.merge(ObjectList.from_sa_objects([
+        create_object("b", "hr", ["employee"]),
+        create_object("c", "crm", ["customer"]),
+    ]))
+
+    assert [grouping.id for grouping in object_list.objects] == ["a", "b", "c"]
+    assert object_list.get_by_id("c").objects[0].sources == {"crm"}
+
+
+def test_merge_overlapping_id_from_another_source():
+    """Test that an id already in the list is merged into its grouping, in place and in position."""
+    object_list = ObjectList.from_sa_objects([
+        create_object("a", "hr", ["employee"], name="Alice"),
+        create_object("b", "hr", ["employee"], name="Bob"),
+    ])
+    object_list.merge(ObjectList.from_sa_objects([create_object("a", "crm", ["customer"], email="alice@example.com")]))
+
+    assert [grouping.id for grouping in object_list.objects] == ["a", "b"]
+    merged = object_list.objects[0]
+    assert merged.sources == {"hr", "crm"}
+    assert merged.types == {"employee", "customer"}
+    assert merged.fields == {"name", "email"}
+    assert object_list.get_by_id("a").objects[0] is merged
+    assert object_list.unique_ids == {("a", "employee", "hr"), ("b", "employee", "hr"), ("a", "customer", "crm")}
+
+
+def test_merge_rebuilds_indexes():
+    """Test that type, source and field indexes built before a merge see the merged objects."""
+    object_list = ObjectList.from_sa_objects([create_object("a", "hr", ["employee"], name="Alice")])
+    assert [grouping.id for grouping in object_list.filter_by_type("customer").objects] == []
+    assert [grouping.id for grouping in object_list.filter_by_source("crm").objects] == []
+    assert object_list.field_value_index("email") == ({}, True)
+
+    object_list.merge(ObjectList.from_sa_objects([
+        create_object("a", "crm", ["customer"], email="alice@example.com"),
+        create_object("b", "crm", ["customer"], email="bob@example.com"),
+    ]))
+
+    assert [grouping.id for grouping in object_list.filter_by_type("customer").objects] == ["a", "b"]
+    assert [grouping.id for grouping in object_list.filter_by_source("crm").objects] == ["a", "b"]
+    buckets, has_missing = object_list.field_value_index("email")
+    assert [grouping.id for grouping in buckets["alice@example.com"]] == ["a"]
+    assert not has_missing
+    assert object_list.types == {"employee", "customer"}
+    assert object_list.id_types == {("a", "employee"), ("a", "customer"), ("b", "customer")}
+
+
+def test_merge_duplicate_leaves_list_untouched():
+    """Test that merging an object the list already has fails without changing the list."""
+    object_list = ObjectList.from_sa_objects([create_object("a", "hr", ["employee"])])
+    with pytest.raises(AssertionError):
+        object_list.merge(ObjectList.from_sa_objects([
+            create_object("b", "hr", ["employee"]),
+            create_object("a", "hr", ["employee"]),
+        ]))
+
+    assert [grouping.id for grouping in object_list.objects] == ["a"]
+    assert object_list.unique_ids == {("a", "employee", "hr")}
+
+
+@pytest.mark.parametrize("query", ["employee[.name =~ 'A']", "employee[.name == 'Alice']"])
+def test_filter_result_unaffected_by_later_merge(query):
+    """Test that a filter keeping every grouping of all_data returns a list that a later merge into all_data doesn't grow."""
+    providers = Providers(connections=[], all_data=ObjectList.from_sa_objects([create_object("a", "hr", ["employee"], name="Alice")]), downloaded_scopes=set())
+    result = execute_query_fully(query, providers)
+    assert result is not providers.all_data
+
+    providers.all_data.merge(ObjectList.from_sa_objects([create_object("b", "hr", ["employee"], name="Alice")]))
+
+    assert [grouping.id for grouping in result.objects] == ["a"]
+    assert [grouping.id for grouping in providers.all_data.objects] == ["a", "b"]
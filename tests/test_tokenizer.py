@@ -3,8 +3,30 @@
 Test the get_tokens_from_query function to ensure it works correctly.
 """
 
+import random
+import pytest
 from sa.query_language.parser import get_tokens_from_query
 
+def scan_tokens(query):
+    """The character-by-character scanner get_tokens_from_query's regex replaced, kept as the reference."""
+    tokens = []
+    current_alphanumeric = ''
+    for i, char in enumerate(query):
+        if char.isalnum() or char == '_':
+            current_alphanumeric += char
+        else:
+            if current_alphanumeric:
+                tokens.append(current_alphanumeric)
+                current_alphanumeric = ''
+            # A minus directly after a word, ] or ) is an operator; anywhere else it's a negative sign
+            if char == '-' and (i == 0 or not query[i-1].isalnum() and query[i-1] != '_' and query[i-1] != ']' and query[i-1] != ')'):
+                current_alphanumeric = '-'
+            else:
+                tokens.append(char)
+    if current_alphanumeric:
+        tokens.append(current_alphanumeric)
+    return tokens
+
 def test_tokenizer():
     """Test various query inputs to ensure proper tokenization."""
     
@@ -70,5 +92,34 @@ def test_tokenizer():
     
     return all_passed
 
+
+@pytest.mark.parametrize("query, expected_tokens", [
+    ("employee[-1]", ["employee", "[", "-1", "]"]),
+    ("a-1", ["a", "-", "1"]),
+    ("x[0]-1", ["x", "[", "0", "]", "-", "1"]),
+    ("(a)-b", ["(", "a", ")", "-", "b"]),
+    ("a - -3", ["a", " ", "-", " ", "-3"]),
+    ("--1", ["-", "-1"]),
+    ("-", ["-"]),
+    (".salary == -1.5", [".", "salary", " ", "=", "=", " ", "-1", ".", "5"]),
+    ("'a b\\n'", ["'", "a", " ", "b", "\\", "n", "'"]),
+    ("#emp_00*", ["#", "emp_00", "*"]),
+    ("\u00e9t\u00e9_2\nx", ["\u00e9t\u00e9_2", "\n", "x"]),
+])
+def test_tokenizer_negative_numbers_and_unicode(query, expected_tokens):
+    """Test where the regex glues a minus sign to the word after it, and that it matches the old scanner."""
+    assert get_tokens_from_query(query) == expected_tokens
+    assert get_tokens_from_query(query) == scan_tokens(query)
+
+
+def test_tokenizer_matches_scanner_on_random_queries():
+    """Test the regex against the old scanner on random queries built from the characters that matter."""
+    rng = random.Random(0)
+    alphabet = "ab1_-])([. '\"\n\u00e9\u00b2"
+    for _ in range(2000):
+        query = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert get_tokens_from_query(query) == scan_tokens(query), query
+
+
 if __name__ == "__main__":
     test_tokenizer() 
\ No newline at end of file